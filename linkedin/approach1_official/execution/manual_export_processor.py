@@ -7,12 +7,11 @@ import csv
 import json
 from pathlib import Path
 from typing import List, Optional, Dict
-from datetime import datetime
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from shared.types import LinkedInProfile, ApproachType, ConnectionDegree
+from shared.types import LinkedInProfile, ApproachType, ConnectionDegree, batch_time, to_dicts
 
 BASE_DIR = Path(__file__).parent.parent.parent
 OUTPUT_DIR = BASE_DIR / ".tmp" / "approach1"
@@ -61,8 +60,7 @@ class ManualExportProcessor:
                         company=row.get('Company', ''),
                         title=row.get('Position', ''),
                         connection_degree=ConnectionDegree.FIRST,  # These are all 1st degree
-                        source_approach=ApproachType.OFFICIAL_API,
-                        scraped_at=datetime.now()
+                        source_approach=ApproachType.OFFICIAL_API
                     )
 
                     if profile.name:
@@ -108,8 +106,7 @@ class ManualExportProcessor:
                         connection_degree=ManualExportProcessor._parse_degree(
                             row.get('Degree', row.get('Connection Degree', ''))
                         ),
-                        source_approach=ApproachType.OFFICIAL_API,
-                        scraped_at=datetime.now()
+                        source_approach=ApproachType.OFFICIAL_API
                     )
 
                     if profile.name:
@@ -181,8 +178,7 @@ class ManualExportProcessor:
                         company=row.get(field_map.get("company", ""), ""),
                         title=row.get(field_map.get("title", ""), ""),
                         industry=row.get(field_map.get("industry", ""), ""),
-                        source_approach=ApproachType.OFFICIAL_API,
-                        scraped_at=datetime.now()
+                        source_approach=ApproachType.OFFICIAL_API
                     )
 
                     if profile.name:
@@ -272,17 +268,19 @@ def process_export(
             else:
                 export_type = "custom"
 
-    if export_type == "connections":
-        profiles = processor.process_connections_export(path)
-    elif export_type == "sales_navigator":
-        profiles = processor.process_sales_navigator_export(path)
-    else:
-        profiles = processor.process_custom_csv(path)
+    # One scraped_at for every imported row
+    with batch_time():
+        if export_type == "connections":
+            profiles = processor.process_connections_export(path)
+        elif export_type == "sales_navigator":
+            profiles = processor.process_sales_navigator_export(path)
+        else:
+            profiles = processor.process_custom_csv(path)
 
     # Save processed profiles
     output_file = OUTPUT_DIR / "processed_profiles.json"
     with open(output_file, "w") as f:
-        json.dump([p.to_dict() for p in profiles], f, indent=2)
+        json.dump(to_dicts(profiles), f, indent=2)
     print(f"Saved {len(profiles)} profiles to {output_file}")
 
     return profiles
@@ -3,8 +3,11 @@ Anti-Detection Utilities for LinkedIn Browser Automation
 Human-like behavior patterns to avoid detection
 """
 
+import asyncio
 import random
+import threading
 import time
+from collections import deque
 from typing import Tuple, Optional
 import numpy as np
 from fake_useragent import UserAgent
@@ -85,6 +88,20 @@ class AntiDetection:
         """Long delay (5-10 seconds)"""
         time.sleep(self.human_delay(7.5))
 
+    def next_delay(self, min_interval: float = 0.0) -> float:
+        """
+        Jittered gap to leave between two outward actions (messages, comments).
+
+        Same distribution as long_wait(), but returned instead of slept so the
+        caller can subtract time already spent and sleep only the remainder.
+
+        Args:
+            min_interval: Lower bound on the gap (e.g. 86400 / daily_limit to
+                spread a daily budget evenly); jitter is applied around
+                whichever of this and the long-wait center is larger
+        """
+        return self.human_delay(max(7.5, min_interval))
+
     def random_scroll_pause(self):
         """Pause like a human reading content"""
         # Occasionally take longer pauses (reading)
@@ -233,6 +250,10 @@ class AntiDetection:
 class RateLimiter:
     """
     Rate limiting for LinkedIn actions.
+
+    Safe to share between threads (e.g. auto_comment's discovery workers):
+    every public method holds one reentrant lock while it reads or updates
+    the counters.
     """
 
     def __init__(
@@ -253,62 +274,114 @@ class RateLimiter:
         self._comment_count = 0
         self._daily_reset = time.time()
 
+        # Adaptive pacing: recent (timestamp, ok) request outcomes scale the
+        # delays callers take via adaptive_delay()
+        self.delay_factor = 1.0
+        self.min_delay_factor = 0.5
+        self.max_delay_factor = 8.0
+        self._outcomes = deque()
+        self._last_failure = None
+        self._last_adjust = time.time()
+
+        self._lock = threading.RLock()
+
     def can_perform_action(self) -> bool:
         """Check if we can perform another action"""
-        self._cleanup_old_actions()
-        return len(self._action_timestamps) < self.actions_per_hour
+        with self._lock:
+            self._cleanup_old_actions()
+            return len(self._action_timestamps) < self.actions_per_hour
 
     def can_scrape_profile(self) -> bool:
         """Check if we can scrape another profile"""
-        return self._profile_count < self.profiles_per_session
+        with self._lock:
+            return self._profile_count < self.profiles_per_session
 
     def can_send_message(self) -> bool:
         """Check if we can send another message"""
-        self._check_daily_reset()
-        return self._message_count < self.messages_per_day
+        with self._lock:
+            self._check_daily_reset()
+            return self._message_count < self.messages_per_day
 
     def can_post_comment(self) -> bool:
         """Check if we can post another comment"""
-        self._check_daily_reset()
-        return self._comment_count < self.comments_per_day
+        with self._lock:
+            self._check_daily_reset()
+            return self._comment_count < self.comments_per_day
 
     def record_action(self):
         """Record that an action was performed"""
-        self._action_timestamps.append(time.time())
+        with self._lock:
+            self._action_timestamps.append(time.time())
 
     def record_profile_scrape(self):
         """Record that a profile was scraped"""
-        self._profile_count += 1
-        self.record_action()
+        with self._lock:
+            self._profile_count += 1
+            self.record_action()
 
     def record_message(self):
         """Record that a message was sent"""
-        self._message_count += 1
-        self.record_action()
+        with self._lock:
+            self._message_count += 1
+            self.record_action()
 
     def record_comment(self):
         """Record that a comment was posted"""
-        self._comment_count += 1
-        self.record_action()
+        with self._lock:
+            self._comment_count += 1
+            self.record_action()
+
+    def record_outcome(self, ok: bool):
+        """
+        Record whether a request came back normally (False for auth walls,
+        unavailable pages and errors) and retune delay_factor.
+
+        More than 5% failures in the last minute slows everything down 1.5x
+        (at most once a minute); three minutes without a failure speeds up
+        by 10%, never below min_delay_factor.
+        """
+        with self._lock:
+            now = time.time()
+            self._outcomes.append((now, ok))
+            if not ok:
+                self._last_failure = now
+            while self._outcomes and self._outcomes[0][0] < now - 180:
+                self._outcomes.popleft()
+
+            since_adjust = now - self._last_adjust
+            recent = [o for t, o in self._outcomes if t >= now - 60]
+            failures = recent.count(False)
+
+            if recent and failures / len(recent) > 0.05 and since_adjust >= 60:
+                self.delay_factor = min(self.max_delay_factor, self.delay_factor * 1.5)
+                self._last_adjust = now
+            elif since_adjust >= 180 and (self._last_failure is None or now - self._last_failure >= 180):
+                self.delay_factor = max(self.min_delay_factor, self.delay_factor * 0.9)
+                self._last_adjust = now
+
+    def adaptive_delay(self, base_delay: float) -> float:
+        """Scale a base delay (seconds) by the current delay_factor"""
+        return base_delay * self.delay_factor
 
     def time_until_next_action(self) -> float:
         """Get seconds until we can perform another action"""
-        if self.can_perform_action():
+        with self._lock:
+            if self.can_perform_action():
+                return 0
+
+            self._cleanup_old_actions()
+            if self._action_timestamps:
+                oldest = min(self._action_timestamps)
+                return (oldest + 3600) - time.time()
             return 0
 
-        self._cleanup_old_actions()
-        if self._action_timestamps:
-            oldest = min(self._action_timestamps)
-            return (oldest + 3600) - time.time()
-        return 0
-
     def _cleanup_old_actions(self):
-        """Remove actions older than 1 hour"""
+        """Remove actions older than 1 hour (caller holds _lock)"""
         cutoff = time.time() - 3600
         self._action_timestamps = [t for t in self._action_timestamps if t > cutoff]
 
     def _check_daily_reset(self):
-        """Reset daily counters if 24 hours have passed"""
+        """Reset daily counters if 24 hours have passed (caller holds _lock)"""
         if time.time() - self._daily_reset > 86400:
             self._message_count = 0
             self._comment_count = 0
@@ -316,19 +389,93 @@ class RateLimiter:
 
     def get_status(self) -> dict:
         """Get current rate limit status"""
-        self._cleanup_old_actions()
-        self._check_daily_reset()
-        return {
-            "actions_this_hour": len(self._action_timestamps),
-            "actions_limit": self.actions_per_hour,
-            "profiles_this_session": self._profile_count,
-            "profiles_limit": self.profiles_per_session,
-            "messages_today": self._message_count,
-            "messages_limit": self.messages_per_day,
-            "comments_today": self._comment_count,
-            "comments_limit": self.comments_per_day,
-            "can_act": self.can_perform_action(),
-            "can_scrape": self.can_scrape_profile(),
-            "can_message": self.can_send_message(),
-            "can_comment": self.can_post_comment()
-        }
+        with self._lock:
+            self._cleanup_old_actions()
+            self._check_daily_reset()
+            return {
+                "actions_this_hour": len(self._action_timestamps),
+                "actions_limit": self.actions_per_hour,
+                "profiles_this_session": self._profile_count,
+                "profiles_limit": self.profiles_per_session,
+                "messages_today": self._message_count,
+                "messages_limit": self.messages_per_day,
+                "comments_today": self._comment_count,
+                "comments_limit": self.comments_per_day,
+                "delay_factor": round(self.delay_factor, 3),
+                "can_act": self.can_perform_action(),
+                "can_scrape": self.can_scrape_profile(),
+                "can_message": self.can_send_message(),
+                "can_comment": self.can_post_comment()
+            }
+
+
+class TokenBucket:
+    """
+    Token bucket for pacing a single kind of action.
+
+    Holds up to `capacity` tokens and refills continuously at `refill_rate`
+    tokens per second. A full bucket lets a burst go out back-to-back; once
+    it is drained, acquire() sleeps just long enough for the next token.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    @classmethod
+    def per_day(cls, daily_limit: int, burst: int) -> "TokenBucket":
+        """Bucket that refills `daily_limit` tokens spread evenly over 24 hours"""
+        return cls(capacity=max(1, burst), refill_rate=daily_limit / 86400)
+
+    def _refill(self):
+        """Add tokens earned since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+        self.last = now
+
+    def time_until_token(self, n: float = 1) -> float:
+        """Seconds until n tokens will be available (0 if they already are)"""
+        self._refill()
+        if self.tokens >= n:
+            return 0.0
+        return (n - self.tokens) / self.refill_rate
+
+    def try_acquire(self, n: float = 1) -> bool:
+        """Take n tokens if available without waiting"""
+        self._refill()
+        if self.tokens >= n:
+            self.tokens -= n
+            return True
+        return False
+
+    def acquire(self, n: float = 1) -> float:
+        """
+        Take n tokens, sleeping until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while not self.try_acquire(n):
+            delay = (n - self.tokens) / self.refill_rate
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    async def acquire_async(self, n: float = 1) -> float:
+        """Async version of acquire() that yields to the event loop while waiting"""
+        waited = 0.0
+        while not self.try_acquire(n):
+            delay = (n - self.tokens) / self.refill_rate
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
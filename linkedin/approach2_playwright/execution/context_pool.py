@@ -0,0 +1,152 @@
+"""
+Browser Context Pool
+Hands out pre-built, logged-in BrowserContexts that share one Browser
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from playwright.sync_api import Browser, BrowserContext
+
+
+class ContextPool:
+    """
+    Pool of BrowserContexts created from a saved LinkedIn session.
+
+    Contexts are far cheaper than browsers, so several are pre-launched on a
+    single Browser. Each one loads the same storage_state, so they all share
+    the login while keeping separate pages and cookie jars at runtime.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int = 2,
+        storage_state_path: Optional[str] = None,
+        idle_timeout: float = 600.0,
+        **context_options
+    ):
+        """
+        Initialize and pre-launch the pool.
+
+        Args:
+            browser: Browser to create contexts on
+            size: Maximum number of contexts (all pre-launched)
+            storage_state_path: Session file every context is created from
+            idle_timeout: Seconds a context may sit unused before it is closed
+            **context_options: Extra kwargs for browser.new_context (viewport, user_agent...)
+        """
+        self.browser = browser
+        self.size = size
+        self.storage_state_path = storage_state_path
+        self.idle_timeout = idle_timeout
+        self.context_options = context_options
+
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._contexts = set()
+
+        for _ in range(size):
+            self._idle.put((self._new_context(), time.monotonic()))
+
+    def _new_context(self) -> BrowserContext:
+        """Create a context from the saved session and track it"""
+        context = self.browser.new_context(
+            storage_state=self.storage_state_path,
+            **self.context_options
+        )
+        with self._lock:
+            self._contexts.add(context)
+        return context
+
+    def _discard(self, context: BrowserContext):
+        """Close a context and stop tracking it"""
+        with self._lock:
+            self._contexts.discard(context)
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Borrow a context for the duration of a with-block.
+
+        Args:
+            timeout: Seconds to wait for a free context (None waits forever)
+        """
+        context = self.get(timeout)
+        try:
+            yield context
+        finally:
+            self.release(context)
+
+    def get(self, timeout: Optional[float] = None) -> BrowserContext:
+        """Take a context out of the pool (pair with release())"""
+        self.reap_idle()
+
+        try:
+            context, _ = self._idle.get_nowait()
+            return context
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_grow = len(self._contexts) < self.size
+        if can_grow:
+            return self._new_context()
+
+        context, _ = self._idle.get(timeout=timeout)
+        return context
+
+    def release(self, context: BrowserContext):
+        """Return a borrowed context to the pool"""
+        with self._lock:
+            tracked = context in self._contexts
+        if tracked:
+            self._idle.put((context, time.monotonic()))
+
+    def reap_idle(self):
+        """
+        Close contexts that have been idle longer than idle_timeout.
+
+        Runs on every acquire rather than in a background thread, because the
+        sync Playwright API may only be driven from the thread that owns it.
+        """
+        now = time.monotonic()
+        keep = []
+
+        while True:
+            try:
+                context, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if now - last_used > self.idle_timeout:
+                self._discard(context)
+            else:
+                keep.append((context, last_used))
+
+        for item in keep:
+            self._idle.put(item)
+
+    def close(self):
+        """Close every context created by the pool"""
+        with self._lock:
+            contexts = list(self._contexts)
+            self._contexts.clear()
+
+        for context in contexts:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+        while not self._idle.empty():
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
@@ -6,14 +6,14 @@ Finds posts in feed and by hashtag for engagement opportunities
 import json
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 from playwright.sync_api import Page, BrowserContext
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from shared.types import LinkedInPost, ApproachType, ScrapingResult
+from shared.types import LinkedInPost, ApproachType, ScrapingResult, to_dicts
 from shared.profile_analyzer import ProfileAnalyzer
 from .linkedin_browser_auth import get_authenticated_context
 from .anti_detection import AntiDetection, RateLimiter
@@ -136,6 +136,82 @@ class LinkedInPostFinder:
 
         return posts
 
+    def iter_posts(
+        self,
+        hashtags: List[str] = None,
+        keywords: List[str] = None,
+        include_feed: bool = True,
+        max_per_source: int = 10
+    ) -> Iterator[LinkedInPost]:
+        """
+        Yield unique posts across hashtags, keyword searches and the main feed
+        as each source finishes, so callers can persist them straight away.
+
+        Args:
+            hashtags: List of hashtags to search
+            keywords: List of keywords to search
+            include_feed: Include posts from main feed
+            max_per_source: Max posts per source
+        """
+        seen_ids = set()
+
+        def unseen(posts):
+            for post in posts:
+                if post.id not in seen_ids:
+                    seen_ids.add(post.id)
+                    yield post
+
+        # Search hashtags
+        for tag in hashtags or []:
+            print(f"Searching hashtag: #{tag}")
+            yield from unseen(self.find_posts_by_hashtag(tag, max_per_source))
+            self.anti_detection.medium_wait()
+
+        # Search keywords
+        for keyword in keywords or []:
+            print(f"Searching keyword: {keyword}")
+            yield from unseen(self.find_posts_by_keyword(keyword, max_per_source))
+            self.anti_detection.medium_wait()
+
+        # Get feed posts
+        if include_feed:
+            print("Scanning feed...")
+            yield from unseen(self.find_posts_in_feed(max_per_source))
+
+    def find_posts(
+        self,
+        hashtags: List[str] = None,
+        keywords: List[str] = None,
+        include_feed: bool = True,
+        max_per_source: int = 10
+    ) -> ScrapingResult:
+        """
+        Find posts across hashtags, keyword searches and the main feed.
+
+        Args:
+            hashtags: List of hashtags to search
+            keywords: List of keywords to search
+            include_feed: Include posts from main feed
+            max_per_source: Max posts per source
+
+        Returns:
+            ScrapingResult with deduplicated posts
+        """
+        unique_posts = list(self.iter_posts(hashtags, keywords, include_feed, max_per_source))
+
+        return ScrapingResult(
+            success=len(unique_posts) > 0,
+            approach=ApproachType.PLAYWRIGHT,
+            posts=unique_posts,
+            errors=[],
+            metadata={
+                "hashtags_searched": hashtags or [],
+                "keywords_searched": keywords or [],
+                "include_feed": include_feed,
+                "total_found": len(unique_posts)
+            }
+        )
+
     def _scrape_feed_posts(self, page: Page, max_posts: int) -> List[LinkedInPost]:
         """Scrape posts from feed or hashtag page"""
         posts = []
@@ -440,8 +516,6 @@ def find_posts(
         ScrapingResult with posts
     """
     playwright, browser, context, auth = get_authenticated_context(headless)
-    all_posts = []
-    errors = []
 
     try:
         finder = LinkedInPostFinder(
@@ -450,54 +524,15 @@ def find_posts(
             rate_limiter=auth.rate_limiter
         )
 
-        # Search hashtags
-        if hashtags:
-            for tag in hashtags:
-                print(f"Searching hashtag: #{tag}")
-                posts = finder.find_posts_by_hashtag(tag, max_per_source)
-                all_posts.extend(posts)
-                auth.anti_detection.medium_wait()
-
-        # Search keywords
-        if keywords:
-            for keyword in keywords:
-                print(f"Searching keyword: {keyword}")
-                posts = finder.find_posts_by_keyword(keyword, max_per_source)
-                all_posts.extend(posts)
-                auth.anti_detection.medium_wait()
-
-        # Get feed posts
-        if include_feed:
-            print("Scanning feed...")
-            posts = finder.find_posts_in_feed(max_per_source)
-            all_posts.extend(posts)
-
-        # Deduplicate
-        seen_ids = set()
-        unique_posts = []
-        for post in all_posts:
-            if post.id not in seen_ids:
-                seen_ids.add(post.id)
-                unique_posts.append(post)
+        result = finder.find_posts(hashtags, keywords, include_feed, max_per_source)
 
         # Save results
         output_file = OUTPUT_DIR / "found_posts.json"
         with open(output_file, "w") as f:
-            json.dump([p.to_dict() for p in unique_posts], f, indent=2)
-        print(f"Saved {len(unique_posts)} posts to {output_file}")
+            json.dump(to_dicts(result.posts), f, indent=2)
+        print(f"Saved {len(result.posts)} posts to {output_file}")
 
-        return ScrapingResult(
-            success=len(unique_posts) > 0,
-            approach=ApproachType.PLAYWRIGHT,
-            posts=unique_posts,
-            errors=errors,
-            metadata={
-                "hashtags_searched": hashtags or [],
-                "keywords_searched": keywords or [],
-                "include_feed": include_feed,
-                "total_found": len(unique_posts)
-            }
-        )
+        return result
 
     finally:
         auth.close()
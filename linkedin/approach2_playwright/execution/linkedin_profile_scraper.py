@@ -13,7 +13,7 @@ from playwright.sync_api import Page, BrowserContext
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from shared.types import LinkedInProfile, ApproachType, ConnectionDegree, ScrapingResult
+from shared.types import LinkedInProfile, ApproachType, ConnectionDegree, ScrapingResult, to_dicts
 from .linkedin_browser_auth import get_authenticated_context
 from .anti_detection import AntiDetection, RateLimiter
 
@@ -399,7 +399,7 @@ def scrape_profiles(profile_urls: List[str], headless: bool = False) -> Scraping
         # Save results
         output_file = OUTPUT_DIR / "scraped_profiles.json"
         with open(output_file, "w") as f:
-            json.dump([p.to_dict() for p in result.profiles], f, indent=2)
+            json.dump(to_dicts(result.profiles), f, indent=2)
         print(f"Saved {len(result.profiles)} profiles to {output_file}")
 
         return result
@@ -16,7 +16,8 @@ from shared.types import (
     LinkedInPost,
     ApproachType,
     ConnectionDegree,
-    ScrapingResult
+    ScrapingResult,
+    batch_time
 )
 
 BASE_DIR = Path(__file__).parent.parent.parent
@@ -55,8 +56,7 @@ class DataNormalizer:
             connection_degree=DataNormalizer._parse_connection_degree(data.get("degree")),
             experience=data.get("jobs", data.get("experience", [])),
             skills=data.get("skills", []),
-            source_approach=ApproachType.THIRDPARTY,
-            scraped_at=datetime.now()
+            source_approach=ApproachType.THIRDPARTY
         )
 
     @staticmethod
@@ -86,8 +86,7 @@ class DataNormalizer:
             connection_degree=ConnectionDegree.OUT_OF_NETWORK,  # Usually not provided
             experience=data.get("experience", data.get("positions", [])),
             skills=DataNormalizer._extract_skills(data.get("skills", [])),
-            source_approach=ApproachType.THIRDPARTY,
-            scraped_at=datetime.now()
+            source_approach=ApproachType.THIRDPARTY
         )
 
     @staticmethod
@@ -113,8 +112,7 @@ class DataNormalizer:
             shares=DataNormalizer._parse_int(data.get("shareCount", data.get("reposts", 0))),
             posted_relative=data.get("postedAgo", data.get("timestamp", "")),
             hashtags=DataNormalizer._extract_hashtags(data.get("postContent", "")),
-            source_approach=ApproachType.THIRDPARTY,
-            scraped_at=datetime.now()
+            source_approach=ApproachType.THIRDPARTY
         )
 
     @staticmethod
@@ -140,8 +138,7 @@ class DataNormalizer:
             shares=DataNormalizer._parse_int(data.get("numShares", data.get("reposts", 0))),
             posted_at=DataNormalizer._parse_datetime(data.get("postedAt", data.get("timestamp"))),
             hashtags=data.get("hashtags", DataNormalizer._extract_hashtags(data.get("text", ""))),
-            source_approach=ApproachType.THIRDPARTY,
-            scraped_at=datetime.now()
+            source_approach=ApproachType.THIRDPARTY
         )
 
     @staticmethod
@@ -162,19 +159,21 @@ class DataNormalizer:
         profiles = []
         errors = []
 
-        for item in data:
-            try:
-                if source == "phantombuster":
-                    profile = DataNormalizer.normalize_phantombuster_profile(item)
-                elif source == "apify":
-                    profile = DataNormalizer.normalize_apify_profile(item)
-                else:
-                    raise ValueError(f"Unknown source: {source}")
-
-                if profile.name:  # Only include if we got a name
-                    profiles.append(profile)
-            except Exception as e:
-                errors.append(f"Failed to normalize profile: {e}")
+        # One scraped_at for the whole batch
+        with batch_time():
+            for item in data:
+                try:
+                    if source == "phantombuster":
+                        profile = DataNormalizer.normalize_phantombuster_profile(item)
+                    elif source == "apify":
+                        profile = DataNormalizer.normalize_apify_profile(item)
+                    else:
+                        raise ValueError(f"Unknown source: {source}")
+
+                    if profile.name:  # Only include if we got a name
+                        profiles.append(profile)
+                except Exception as e:
+                    errors.append(f"Failed to normalize profile: {e}")
 
         return ScrapingResult(
             success=len(profiles) > 0,
@@ -206,19 +205,21 @@ class DataNormalizer:
         posts = []
         errors = []
 
-        for item in data:
-            try:
-                if source == "phantombuster":
-                    post = DataNormalizer.normalize_phantombuster_post(item)
-                elif source == "apify":
-                    post = DataNormalizer.normalize_apify_post(item)
-                else:
-                    raise ValueError(f"Unknown source: {source}")
-
-                if post.content:  # Only include if we got content
-                    posts.append(post)
-            except Exception as e:
-                errors.append(f"Failed to normalize post: {e}")
+        # One scraped_at for the whole batch
+        with batch_time():
+            for item in data:
+                try:
+                    if source == "phantombuster":
+                        post = DataNormalizer.normalize_phantombuster_post(item)
+                    elif source == "apify":
+                        post = DataNormalizer.normalize_apify_post(item)
+                    else:
+                        raise ValueError(f"Unknown source: {source}")
+
+                    if post.content:  # Only include if we got content
+                        posts.append(post)
+                except Exception as e:
+                    errors.append(f"Failed to normalize post: {e}")
 
         return ScrapingResult(
             success=len(posts) > 0,
@@ -3,11 +3,16 @@ Bulk LinkedIn Profile Scraper with Google Sheets Export
 Scrapes multiple profiles and exports to Google Sheets
 """
 
+import asyncio
+import csv
 import json
+import tempfile
 import time
 import sys
+from contextlib import closing, contextmanager
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlparse
 
 # Setup paths
 BASE_DIR = Path(__file__).parent
@@ -16,11 +21,20 @@ sys.path.insert(0, str(BASE_DIR / "approach2_playwright" / "execution"))
 sys.path.insert(0, str(BASE_DIR.parent / "execution"))  # For export_to_sheet
 
 from shared.types import LinkedInProfile, ApproachType, ConnectionDegree
+from search_and_scrape import SCRAPE_CONCURRENCY
 from approach2_playwright.execution.anti_detection import AntiDetection, RateLimiter
 from dotenv import load_dotenv
 import os
 import gspread
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+
+# Optional: fcntl (POSIX only) serializes rate limit state across processes
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 # Load env
 load_dotenv(BASE_DIR / "approach2_playwright" / ".env.approach2")
@@ -28,26 +42,256 @@ load_dotenv(BASE_DIR / "approach2_playwright" / ".env.approach2")
 OUTPUT_DIR = BASE_DIR / ".tmp" / "bulk_scrape"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+CREDS_FILE = BASE_DIR.parent / "credentials.json"
+GOOGLE_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+]
+_GSPREAD_CLIENT = None
+
+SESSION_FILE = OUTPUT_DIR / "linkedin_session.json"
+RATE_LIMIT_STATE_FILE = OUTPUT_DIR / "ratelimit_state.json"
+PROFILES_JSONL = OUTPUT_DIR / "scraped_profiles.jsonl"
+PROFILES_CSV = OUTPUT_DIR / "scraped_profiles.csv"
+
+# Recycle the worker page + context every N profiles to bound Chromium leaks
+RECYCLE_EVERY = int(os.getenv("RECYCLE_EVERY", "25"))
+
+# Extra Chromium flags for long bulk runs (no GPU/zygote processes, no /dev/shm)
+LOW_MEMORY_BROWSER_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-zygote",
+    "--disable-accelerated-2d-canvas",
+    "--disable-webgl",
+]
+
+# Relaunch the whole browser every N context recycles; closing contexts frees
+# JS heap but Chromium's native allocator keeps its committed pages
+BROWSER_RESTART_EVERY = int(os.getenv("BROWSER_RESTART_EVERY", "5"))
+
+# Finds the "N connections/followers" text in the browser so only the match
+# crosses the Playwright channel: known top-card elements first, then <main>
+CONNECTIONS_JS = """
+() => {
+    const re = /(\\d+[\\d,]*)\\s*(?:connections?|followers?)/i;
+    const selectors = [
+        'a[href*="/connections"]',
+        'a[href*="/followers"]',
+        '.pv-top-card--list li',
+        'section:has(a[href*="overlay/contact-info"]) .t-black--light',
+    ];
+    for (const sel of selectors) {
+        let els = [];
+        try { els = document.querySelectorAll(sel); } catch (e) { continue; }
+        for (const el of els) {
+            const m = (el.innerText || '').match(re);
+            if (m) return m[0];
+        }
+    }
+    const main = document.querySelector('main');
+    const m = main ? (main.innerText || '').match(re) : null;
+    return m ? m[0] : '';
+}
+"""
+
+# About text, trimmed and cut to 500 code points in the browser (Array.from
+# keeps surrogate pairs intact, matching Python slicing)
+ABOUT_JS = """
+() => {
+    const anchor = document.getElementById('about');
+    if (!anchor) return '';
+    const section = anchor.closest('section') || anchor.parentElement?.parentElement;
+    const container = section?.querySelector('div.display-flex');
+    return Array.from((container?.innerText || '').trim()).slice(0, 500).join('');
+}
+"""
+
+PROFILE_HEADERS = ["Name", "Headline", "Location", "About", "Connections", "Profile URL", "Scraped At"]
+
+
+def profile_to_row(p: dict) -> list:
+    """Flatten a scraped profile dict into a CSV/Sheets row"""
+    return [
+        p.get("name", ""),
+        p.get("headline", ""),
+        p.get("location", ""),
+        (p.get("about", "") or "")[:500],
+        p.get("connections", ""),
+        p.get("profile_url", ""),
+        p.get("scraped_at", "")
+    ]
+
+
+def normalize_profile_url(url: str):
+    """
+    Canonicalize a LinkedIn profile URL to https://www.linkedin.com/in/<slug>/.
+
+    Drops query strings/fragments and sub-pages. Returns None for anything
+    that is not a profile URL.
+    """
+    path = urlparse(url.strip()).path
+    parts = [p for p in path.split("/") if p]
+    if len(parts) < 2 or parts[0] != "in":
+        return None
+    return f"https://www.linkedin.com/in/{parts[1].lower()}/"
+
+
+def iter_scraped_profiles(jsonl_file: Path = PROFILES_JSONL):
+    """Yield profiles one at a time from the incremental JSONL output"""
+    with open(jsonl_file, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class PersistentRateLimiter(RateLimiter):
+    """
+    RateLimiter whose hourly cap is a token bucket persisted to disk.
+
+    The bucket (capacity = actions_per_hour, refilled continuously at
+    actions_per_hour / 3600 tokens per second) survives process restarts,
+    so back-to-back runs cannot burst past the intended hourly limit.
+
+    Processes sharing the state file take an flock on a sibling .lock file
+    and reload the state before every check or spend, so concurrent runs
+    draw from one bucket; threads in one process also hold self._lock.
+    """
+
+    def __init__(self, *args, state_file: Path = RATE_LIMIT_STATE_FILE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.state_file = state_file
+        self.lock_file = state_file.with_suffix(".lock")
+        self.capacity = float(self.actions_per_hour)
+        self.refill_rate = self.actions_per_hour / 3600.0
+        self.tokens = self.capacity
+        self.last_refill = time.time()
+        self._load_state()
+
+    @contextmanager
+    def _shared_state(self):
+        """
+        Hold the thread lock and the cross-process flock, with the bucket
+        reloaded from disk, for a load-refill-consume-save sequence.
+        """
+        with self._lock:
+            if fcntl is None:
+                self._load_state()
+                yield
+                return
+            with open(self.lock_file, "a") as lock_f:
+                fcntl.flock(lock_f, fcntl.LOCK_EX)
+                try:
+                    self._load_state()
+                    yield
+                finally:
+                    fcntl.flock(lock_f, fcntl.LOCK_UN)
+
+    def _load_state(self):
+        """Restore bucket state from a previous run, if any"""
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state = json.load(f)
+            self.set_state(
+                tokens=float(state["tokens"]),
+                last_refill=datetime.fromisoformat(state["last_refill"]).timestamp()
+            )
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring invalid rate limit state: {e}")
+
+    def set_state(self, tokens: float, last_refill: float):
+        """Set bucket state (tokens available and epoch of last refill)"""
+        with self._lock:
+            self.tokens = max(0.0, min(self.capacity, tokens))
+            self.last_refill = last_refill
+
+    def _save_state(self):
+        """Atomically write bucket state next to the scrape output (caller holds _shared_state)"""
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.state_file.parent,
+            prefix=self.state_file.name + ".", suffix=".tmp", delete=False
+        ) as f:
+            json.dump({
+                "tokens": self.tokens,
+                "last_refill": datetime.fromtimestamp(self.last_refill).isoformat()
+            }, f)
+        os.replace(f.name, self.state_file)
+
+    def _refill(self):
+        """Add tokens accrued since the last refill (caller holds _lock)"""
+        now = time.time()
+        elapsed = max(0.0, now - self.last_refill)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
+
+    def can_perform_action(self) -> bool:
+        """Check if a token is available in the hourly bucket"""
+        with self._shared_state():
+            self._refill()
+            return self.tokens >= 1.0
+
+    def can_scrape_profile(self) -> bool:
+        """Check session cap and hourly bucket"""
+        with self._lock:
+            return super().can_scrape_profile() and self.can_perform_action()
+
+    def time_until_next_action(self) -> float:
+        """Get seconds until the bucket holds a full token"""
+        with self._lock:
+            if self.can_perform_action():
+                return 0
+            return (1.0 - self.tokens) / self.refill_rate
+
+    def record_profile_scrape(self):
+        """Record a scrape, consume a token and persist the bucket"""
+        with self._shared_state():
+            super().record_profile_scrape()
+            self._refill()
+            self.tokens = max(0.0, self.tokens - 1.0)
+            self._save_state()
+
 
 class BulkProfileScraper:
     """Scrapes multiple LinkedIn profiles with rate limiting"""
 
-    def __init__(self, headless: bool = False):
+    def __init__(
+        self,
+        headless: bool = False,
+        context=None,
+        anti_detection: AntiDetection = None,
+        rate_limiter: RateLimiter = None
+    ):
+        """
+        Args:
+            headless: Run browser in headless mode
+            context: Already-authenticated BrowserContext to reuse (the scraper
+                then never launches, recycles or closes a browser itself)
+            anti_detection: Shared AntiDetection instance
+            rate_limiter: Shared RateLimiter instance
+        """
         self.headless = headless
-        self.anti_detection = AntiDetection()
-        self.rate_limiter = RateLimiter(
+        self.anti_detection = anti_detection or AntiDetection()
+        self.rate_limiter = rate_limiter or PersistentRateLimiter(
             actions_per_hour=int(os.getenv("ACTIONS_PER_HOUR", "20")),
             profiles_per_session=int(os.getenv("PROFILES_PER_SESSION", "50")),
         )
         self.playwright = None
         self.browser = None
-        self.context = None
+        self.context = context
+        self._owns_browser = context is None
+        self.viewport = None
+        self._context_cycles = 0
         self.profiles_scraped = []
 
     def start_browser(self):
-        """Start browser and login"""
+        """Start browser and login (no-op when using a shared context)"""
         from playwright.sync_api import sync_playwright
 
+        if not self._owns_browser:
+            return
+
         email = os.getenv("LINKEDIN_EMAIL")
         password = os.getenv("LINKEDIN_PASSWORD")
 
@@ -56,61 +300,93 @@ class BulkProfileScraper:
 
         self.playwright = sync_playwright().start()
 
-        viewport = self.anti_detection.get_viewport_size()
+        self.viewport = self.anti_detection.get_viewport_size()
         self.browser = self.playwright.chromium.launch(
             headless=self.headless,
-            args=self.anti_detection.get_browser_args()
+            args=self._browser_args()
         )
 
-        session_file = OUTPUT_DIR / "linkedin_session.json"
-
         # Try existing session
-        if session_file.exists():
+        if SESSION_FILE.exists():
+            session_valid = False
             try:
-                self.context = self.browser.new_context(
-                    storage_state=str(session_file),
-                    viewport={"width": viewport[0], "height": viewport[1]},
-                    user_agent=self.anti_detection.user_agent
-                )
-                page = self.context.new_page()
-                page.goto("https://www.linkedin.com/feed/")
-                time.sleep(3)
-                if "/feed" in page.url:
-                    print("Reusing existing session")
-                    page.close()
-                    return
-                page.close()
-                self.context.close()
-            except:
+                self.context = self._new_context(storage_state=str(SESSION_FILE))
+                with closing(self.context.new_page()) as page:
+                    page.goto("https://www.linkedin.com/feed/")
+                    time.sleep(3)
+                    session_valid = "/feed" in page.url
+            except Exception:
                 pass
 
+            if session_valid:
+                print("Reusing existing session")
+                return
+            if self.context:
+                self.context.close()
+
         # Fresh login
-        self.context = self.browser.new_context(
-            viewport={"width": viewport[0], "height": viewport[1]},
-            user_agent=self.anti_detection.user_agent
-        )
+        self.context = self._new_context()
 
-        page = self.context.new_page()
-        print("Logging in to LinkedIn...")
-        page.goto("https://www.linkedin.com/login")
-        time.sleep(2)
+        with closing(self.context.new_page()) as page:
+            print("Logging in to LinkedIn...")
+            page.goto("https://www.linkedin.com/login")
+            time.sleep(2)
 
-        page.fill('#username', email)
-        page.fill('#password', password)
-        page.click('button[type="submit"]')
-        time.sleep(5)
+            page.fill('#username', email)
+            page.fill('#password', password)
+            page.click('button[type="submit"]')
+            time.sleep(5)
 
-        if "/feed" not in page.url and "/login" not in page.url:
-            print("Waiting for login to complete...")
-            time.sleep(10)
+            if "/feed" not in page.url and "/login" not in page.url:
+                print("Waiting for login to complete...")
+                time.sleep(10)
 
-        self.context.storage_state(path=str(session_file))
-        print("Login successful!")
-        page.close()
+            self.context.storage_state(path=str(SESSION_FILE))
+            print("Login successful!")
 
-    def scrape_profile(self, profile_url: str) -> dict:
-        """Scrape a single profile"""
-        page = self.context.new_page()
+    def _browser_args(self) -> list:
+        """Stealth args plus flags that trim Chromium's memory footprint"""
+        args = self.anti_detection.get_browser_args()
+        return args + [a for a in LOW_MEMORY_BROWSER_ARGS if a not in args]
+
+    def _new_context(self, storage_state: str = None):
+        """Create a browser context with the scraper's viewport and user agent"""
+        return self.browser.new_context(
+            storage_state=storage_state,
+            viewport={"width": self.viewport[0], "height": self.viewport[1]},
+            user_agent=self.anti_detection.user_agent
+        )
+
+    def _recycle_context(self):
+        """
+        Save the session, then replace the context to release leaked memory.
+        Every BROWSER_RESTART_EVERY cycles the browser process is relaunched too.
+        """
+        self.context.storage_state(path=str(SESSION_FILE))
+        self.context.close()
+        self._context_cycles += 1
+
+        if self._context_cycles >= BROWSER_RESTART_EVERY:
+            self.browser.close()
+            self.browser = self.playwright.chromium.launch(
+                headless=self.headless,
+                args=self._browser_args()
+            )
+            self._context_cycles = 0
+
+        self.context = self._new_context(storage_state=str(SESSION_FILE))
+
+    def scrape_profile(self, profile_url: str, page=None) -> dict:
+        """
+        Scrape a single profile.
+
+        Args:
+            profile_url: Profile URL to scrape
+            page: Worker page to navigate (a throwaway page is opened if None)
+        """
+        own_page = page is None
+        if own_page:
+            page = self.context.new_page()
         profile_data = {}
 
         try:
@@ -119,7 +395,6 @@ class BulkProfileScraper:
 
             # Check if we hit authwall
             if "authwall" in page.url or "login" in page.url:
-                page.close()
                 return {
                     "name": "AUTH_REQUIRED",
                     "headline": "Profile requires login",
@@ -176,25 +451,14 @@ class BulkProfileScraper:
             # About section
             about = ""
             try:
-                about_section = page.locator('#about')
-                if about_section.count() > 0:
-                    about_section.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    # Get the next sibling container
-                    about_container = page.locator('#about').locator('..').locator('..').locator('div.display-flex')
-                    if about_container.count() > 0:
-                        about = about_container.first.inner_text().strip()[:500]
+                about = page.evaluate(ABOUT_JS)
             except:
                 pass
 
             # Connections
             connections = ""
             try:
-                page_text = page.inner_text('body')
-                import re
-                conn_match = re.search(r'(\d+[\d,]*)\s*(?:connections?|followers?)', page_text, re.IGNORECASE)
-                if conn_match:
-                    connections = conn_match.group(0)
+                connections = page.evaluate(CONNECTIONS_JS)
             except:
                 pass
 
@@ -219,121 +483,387 @@ class BulkProfileScraper:
                 "scraped_at": datetime.now().isoformat()
             }
         finally:
-            page.close()
+            if own_page:
+                page.close()
 
         return profile_data
 
-    def scrape_multiple(self, profile_urls: list, max_profiles: int = 100) -> list:
-        """Scrape multiple profiles with rate limiting"""
+    def iter_scrape(self, profile_urls: list, max_profiles: int = 100):
+        """
+        Scrape profiles with rate limiting, yielding each one as it completes.
+
+        Every profile is appended to the JSONL and CSV outputs as soon as it is
+        scraped, so a crash mid-run keeps everything collected so far and
+        memory stays flat regardless of batch size.
+        """
         self.start_browser()
-        results = []
 
         # Warm up session
         print("Warming up session...")
+        with closing(self.context.new_page()) as page:
+            try:
+                page.goto("https://www.linkedin.com/feed/", timeout=60000)
+                time.sleep(3)
+                for _ in range(2):
+                    page.mouse.wheel(0, 300)
+                    time.sleep(2)
+            except Exception as e:
+                print(f"Warm up warning: {e}")
+
+        total = min(len(profile_urls), max_profiles)
+        print(f"\nScraping {total} profiles...")
+
+        count = 0
         page = self.context.new_page()
         try:
-            page.goto("https://www.linkedin.com/feed/", timeout=60000)
-            time.sleep(3)
-            for _ in range(2):
-                page.mouse.wheel(0, 300)
-                time.sleep(2)
-        except Exception as e:
-            print(f"Warm up warning: {e}")
+            with open(PROFILES_JSONL, "w", encoding="utf-8") as jsonl_f, \
+                    open(PROFILES_CSV, "w", newline="", encoding="utf-8") as csv_f:
+                csv_writer = csv.writer(csv_f)
+                csv_writer.writerow(PROFILE_HEADERS)
+
+                for i, url in enumerate(profile_urls[:max_profiles]):
+                    if not self.rate_limiter.can_scrape_profile():
+                        self._report_limit(i)
+                        break
+
+                    print(f"[{i+1}/{total}] Scraping: {url[:60]}...")
+
+                    profile = self.scrape_profile(url, page)
+
+                    if profile.get("name") == "ERROR":
+                        # Page may be wedged after a failed navigation - replace it
+                        page.close()
+                        page = self.context.new_page()
+
+                    # Persist immediately
+                    json.dump(profile, jsonl_f, ensure_ascii=False)
+                    jsonl_f.write("\n")
+                    jsonl_f.flush()
+                    csv_writer.writerow(profile_to_row(profile))
+                    csv_f.flush()
+                    count += 1
+
+                    if profile.get("name") and profile["name"] != "ERROR":
+                        print(f"  [OK] {profile['name']} - {profile['headline'][:50] if profile.get('headline') else 'N/A'}")
+                    else:
+                        print(f"  [FAIL] {profile.get('headline', 'Unknown error')[:50]}")
+
+                    yield profile
+
+                    # Rate limiting delay
+                    delay = self.anti_detection.human_delay(3.0)
+                    time.sleep(delay)
+
+                    # Take breaks
+                    if i > 0 and i % 10 == 0:
+                        print(f"\n  Taking a short break...")
+                        time.sleep(self.anti_detection.human_delay(15.0))
+
+                    if self._owns_browser and count % RECYCLE_EVERY == 0:
+                        page.close()
+                        self._recycle_context()
+                        page = self.context.new_page()
+
         finally:
             page.close()
 
-        total = min(len(profile_urls), max_profiles)
-        print(f"\nScraping {total} profiles...")
+        print(f"\nSaved {count} profiles to {PROFILES_JSONL}")
+        print(f"  CSV: {PROFILES_CSV}")
 
-        for i, url in enumerate(profile_urls[:max_profiles]):
-            if not self.rate_limiter.can_scrape_profile():
-                print(f"\nRate limit reached after {i} profiles. Stopping.")
-                break
+    def _report_limit(self, scraped: int):
+        """Say which limit stopped the run after `scraped` profiles"""
+        if self.rate_limiter.can_perform_action():
+            print(f"\nRate limit reached after {scraped} profiles. Stopping.")
+        else:
+            wait = self.rate_limiter.time_until_next_action()
+            print(f"\nHourly limit reached after {scraped} profiles "
+                  f"(next token in {wait / 60:.0f} min). Stopping.")
 
-            print(f"[{i+1}/{total}] Scraping: {url[:60]}...")
+    def scrape_multiple(self, profile_urls: list, max_profiles: int = 100) -> list:
+        """Scrape multiple profiles with rate limiting"""
+        results = list(self.iter_scrape(profile_urls, max_profiles))
+        self.profiles_scraped = results
+        return results
 
-            profile = self.scrape_profile(url)
-            results.append(profile)
+    async def _scrape_profile_async(self, page, profile_url: str) -> dict:
+        """Async mirror of scrape_profile() for the concurrent scraper"""
+        try:
+            await page.goto(profile_url, wait_until="networkidle", timeout=30000)
+            await asyncio.sleep(5)
 
-            if profile.get("name") and profile["name"] != "ERROR":
-                print(f"  [OK] {profile['name']} - {profile['headline'][:50] if profile.get('headline') else 'N/A'}")
-            else:
-                print(f"  [FAIL] {profile.get('headline', 'Unknown error')[:50]}")
+            # Check if we hit authwall
+            if "authwall" in page.url or "login" in page.url:
+                return {
+                    "name": "AUTH_REQUIRED",
+                    "headline": "Profile requires login",
+                    "profile_url": profile_url,
+                    "scraped_at": datetime.now().isoformat()
+                }
 
-            # Rate limiting delay
-            delay = self.anti_detection.human_delay(3.0)
-            time.sleep(delay)
+            page_title = await page.title()
 
-            # Take breaks
-            if i > 0 and i % 10 == 0:
-                print(f"\n  Taking a short break...")
-                time.sleep(self.anti_detection.human_delay(15.0))
+            # Name
+            name = ""
+            try:
+                h1_el = page.locator('h1').first
+                if await h1_el.count() > 0:
+                    name = (await h1_el.inner_text()).strip()
+            except:
+                pass
 
-        self.profiles_scraped = results
+            # Headline
+            headline = ""
+            try:
+                headline_el = page.locator('.text-body-medium').first
+                if await headline_el.count() > 0:
+                    headline = (await headline_el.inner_text()).strip()
+            except:
+                pass
 
-        # Save to JSON
-        output_file = OUTPUT_DIR / "scraped_profiles.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        print(f"\nSaved {len(results)} profiles to {output_file}")
+            # Location
+            location = ""
+            try:
+                loc_el = page.locator('.text-body-small.inline.t-black--light').first
+                if await loc_el.count() > 0:
+                    location = (await loc_el.inner_text()).strip()
+            except:
+                pass
 
-        return results
+            # Fallback - first lines of the main profile section
+            if not name:
+                try:
+                    main_section = page.locator('main section').first
+                    if await main_section.count() > 0:
+                        all_text = await main_section.inner_text()
+                        lines = [l.strip() for l in all_text.split('\n') if l.strip()]
+                        if lines:
+                            name = lines[0] if len(lines) > 0 else ""
+                            headline = lines[1] if len(lines) > 1 else ""
+                            location = lines[2] if len(lines) > 2 else ""
+                except:
+                    pass
 
-    def close(self):
-        """Clean up browser"""
-        if self.context:
-            self.context.close()
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
+            # About section
+            about = ""
+            try:
+                about = await page.evaluate(ABOUT_JS)
+            except:
+                pass
 
+            # Connections
+            connections = ""
+            try:
+                connections = await page.evaluate(CONNECTIONS_JS)
+            except:
+                pass
 
-def export_to_csv(profiles: list):
-    """Export profiles to CSV file"""
-    import csv
+            return {
+                "name": name,
+                "headline": headline,
+                "location": location,
+                "about": about,
+                "connections": connections,
+                "profile_url": profile_url,
+                "page_title": page_title,
+                "scraped_at": datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            return {
+                "name": "ERROR",
+                "headline": str(e)[:200],
+                "profile_url": profile_url,
+                "scraped_at": datetime.now().isoformat()
+            }
+
+    async def iter_scrape_async(
+        self,
+        profile_urls: list,
+        max_profiles: int = 100,
+        concurrency: int = SCRAPE_CONCURRENCY,
+        bucket=None,
+        context=None
+    ):
+        """
+        Scrape profiles concurrently with async Playwright, yielding each one
+        as soon as it finishes (completion order, not input order).
+
+        Up to `concurrency` profile pages load at once in a single context, so
+        network waits overlap instead of adding up. Rate-limit budget is
+        reserved under a lock before each scrape starts.
+
+        Args:
+            profile_urls: Profile URLs to scrape
+            max_profiles: Cap on profiles taken from profile_urls
+            concurrency: Pages loading at the same time
+            bucket: Optional TokenBucket awaited before each navigation
+            context: Logged-in async BrowserContext to scrape on (left open);
+                if None, a browser is launched from SESSION_FILE (running the
+                sync login flow first if that doesn't exist) and closed after
+        """
+        if context is not None:
+            async for profile in self._iter_scrape_on_context(
+                context, profile_urls[:max_profiles], concurrency, bucket
+            ):
+                yield profile
+            return
+
+        from playwright.async_api import async_playwright
+
+        if not SESSION_FILE.exists():
+            self.start_browser()
+            self.close()
+
+        viewport = self.viewport or self.anti_detection.get_viewport_size()
+
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=self.headless,
+                args=self._browser_args()
+            )
+            try:
+                context = await browser.new_context(
+                    storage_state=str(SESSION_FILE),
+                    viewport={"width": viewport[0], "height": viewport[1]},
+                    user_agent=self.anti_detection.user_agent
+                )
+                async for profile in self._iter_scrape_on_context(
+                    context, profile_urls[:max_profiles], concurrency, bucket
+                ):
+                    yield profile
+            finally:
+                await browser.close()
+
+    async def _iter_scrape_on_context(self, context, urls: list, concurrency: int, bucket=None):
+        """iter_scrape_async's worker loop on a given context (opened pages are closed)"""
+        sem = asyncio.Semaphore(concurrency)
+        lock = asyncio.Lock()
+
+        # Set once the rate limiter says no; scrapes already running finish,
+        # every one not yet started returns None straight away
+        stopped = False
+        started = 0
+
+        async def bounded(url: str):
+            nonlocal stopped, started
+            if stopped:
+                return None
+            async with sem:
+                async with lock:
+                    if stopped:
+                        return None
+                    if not self.rate_limiter.can_scrape_profile():
+                        stopped = True
+                        self._report_limit(started)
+                        return None
+                    self.rate_limiter.record_profile_scrape()
+                    started += 1
+
+                if bucket is not None:
+                    await bucket.acquire_async()
+
+                page = await context.new_page()
+                try:
+                    profile = await self._scrape_profile_async(page, url)
+                finally:
+                    await page.close()
 
-    csv_file = OUTPUT_DIR / "scraped_profiles.csv"
+                await asyncio.sleep(self.anti_detection.human_delay(3.0))
+                return profile
 
-    headers = ["Name", "Headline", "Location", "About", "Connections", "Profile URL", "Scraped At"]
+        tasks = [asyncio.ensure_future(bounded(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                profile = await next_done
+                if profile is not None:
+                    yield profile
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def scrape_multiple_async(
+        self,
+        profile_urls: list,
+        max_profiles: int = 100,
+        concurrency: int = SCRAPE_CONCURRENCY
+    ) -> list:
+        """
+        Scrape profiles concurrently, persisting each to JSONL/CSV as it
+        completes. See iter_scrape_async().
+        """
+        total = min(len(profile_urls), max_profiles)
+        print(f"\nScraping {total} profiles ({concurrency} at a time)...")
 
-    with open(csv_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
+        results = []
 
-        for p in profiles:
-            writer.writerow([
-                p.get("name", ""),
-                p.get("headline", ""),
-                p.get("location", ""),
-                (p.get("about", "") or "")[:500],
-                p.get("connections", ""),
-                p.get("profile_url", ""),
-                p.get("scraped_at", "")
-            ])
+        with open(PROFILES_JSONL, "w", encoding="utf-8") as jsonl_f, \
+                open(PROFILES_CSV, "w", newline="", encoding="utf-8") as csv_f:
+            csv_writer = csv.writer(csv_f)
+            csv_writer.writerow(PROFILE_HEADERS)
 
-    print(f"\nExported {len(profiles)} profiles to CSV:")
-    print(f"  {csv_file}")
+            async for profile in self.iter_scrape_async(profile_urls, max_profiles, concurrency):
+                json.dump(profile, jsonl_f, ensure_ascii=False)
+                jsonl_f.write("\n")
+                jsonl_f.flush()
+                csv_writer.writerow(profile_to_row(profile))
+                csv_f.flush()
 
-    return csv_file
+                results.append(profile)
+                status = "OK" if profile.get("name") not in ("", "ERROR") else "FAIL"
+                print(f"[{len(results)}/{total}] [{status}] {profile.get('profile_url', '')[:60]}")
 
+        print(f"\nSaved {len(results)} profiles to {PROFILES_JSONL}")
 
-def export_to_google_sheet(profiles: list, sheet_name: str = "LinkedIn Profiles"):
-    """Export profiles to Google Sheet"""
-    creds_file = BASE_DIR.parent / "credentials.json"
+        self.profiles_scraped = results
+        return results
 
-    if not creds_file.exists():
-        print(f"\nGoogle credentials not found at {creds_file}")
+    def close(self):
+        """Clean up browser; each step runs even if an earlier one fails"""
+        if not self._owns_browser:
+            return
+        try:
+            if self.context:
+                self.context.close()
+        finally:
+            try:
+                if self.browser:
+                    self.browser.close()
+            finally:
+                if self.playwright:
+                    self.playwright.stop()
+                self.playwright = self.browser = self.context = None
+
+
+def _gspread_client():
+    """
+    Get the shared gspread client, authorizing on first use.
+
+    Credentials parsing and the HTTP session are reused across exports; the
+    session keeps a pool of keep-alive connections to the Sheets API.
+    """
+    global _GSPREAD_CLIENT
+    if _GSPREAD_CLIENT is None:
+        creds = Credentials.from_service_account_file(str(CREDS_FILE), scopes=GOOGLE_SCOPES)
+        session = AuthorizedSession(creds)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        session.mount("https://", adapter)
+        _GSPREAD_CLIENT = gspread.Client(creds, session=session)
+    return _GSPREAD_CLIENT
+
+
+def export_to_google_sheet(profiles, sheet_name: str = "LinkedIn Profiles"):
+    """Export profiles (any iterable of dicts) to Google Sheet"""
+    if not CREDS_FILE.exists():
+        print(f"\nGoogle credentials not found at {CREDS_FILE}")
         print("To enable Google Sheets export, add your credentials.json file")
         return None
 
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive"
-    ]
+    client = _gspread_client()
 
-    creds = Credentials.from_service_account_file(str(creds_file), scopes=scopes)
-    client = gspread.authorize(creds)
+    # Prepare data
+    rows = [PROFILE_HEADERS]
+    rows.extend(profile_to_row(p) for p in profiles)
 
     # Create or open spreadsheet
     try:
@@ -341,7 +871,7 @@ def export_to_google_sheet(profiles: list, sheet_name: str = "LinkedIn Profiles"
         print(f"Opened existing spreadsheet: {sheet_name}")
     except gspread.SpreadsheetNotFound:
         spreadsheet = client.create(sheet_name)
-        spreadsheet.share(None, perm_type='anyone', role='writer')
+        spreadsheet.share(None, perm_type='anyone', role='writer', notify=False)
         print(f"Created new spreadsheet: {sheet_name}")
 
     # Get or create worksheet
@@ -349,29 +879,21 @@ def export_to_google_sheet(profiles: list, sheet_name: str = "LinkedIn Profiles"
         worksheet = spreadsheet.worksheet("Profiles")
         worksheet.clear()
     except gspread.WorksheetNotFound:
-        worksheet = spreadsheet.add_worksheet("Profiles", rows=1000, cols=10)
-
-    # Headers
-    headers = ["Name", "Headline", "Location", "About", "Connections", "Profile URL", "Scraped At"]
-
-    # Prepare data
-    rows = [headers]
-    for p in profiles:
-        rows.append([
-            p.get("name", ""),
-            p.get("headline", ""),
-            p.get("location", ""),
-            p.get("about", "")[:500] if p.get("about") else "",
-            p.get("connections", ""),
-            p.get("profile_url", ""),
-            p.get("scraped_at", "")
-        ])
-
-    # Write to sheet
-    worksheet.update(rows, value_input_option="RAW")
+        spreadsheet.batch_update({"requests": [{
+            "addSheet": {"properties": {
+                "title": "Profiles",
+                "gridProperties": {"rowCount": max(1000, len(rows)), "columnCount": 10}
+            }}
+        }]})
+
+    # Write headers + data in a single values:batchUpdate call
+    spreadsheet.values_batch_update({
+        "valueInputOption": "RAW",
+        "data": [{"range": "Profiles!A1", "values": rows}]
+    })
 
     sheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet.id}"
-    print(f"\nExported {len(profiles)} profiles to Google Sheets:")
+    print(f"\nExported {len(rows) - 1} profiles to Google Sheets:")
     print(f"  {sheet_url}")
 
     return sheet_url
@@ -388,8 +910,15 @@ def main():
 
     if urls_file.exists():
         with open(urls_file) as f:
-            profile_urls = [line.strip() for line in f if line.strip() and "linkedin.com/in/" in line]
+            raw_urls = [line.strip() for line in f if line.strip() and "linkedin.com/in/" in line]
+
+        # Normalize + dedupe (keeping file order) so each profile is scraped once
+        profile_urls = list(dict.fromkeys(
+            u for u in map(normalize_profile_url, raw_urls) if u
+        ))
         print(f"Loaded {len(profile_urls)} URLs from {urls_file}")
+        if len(raw_urls) != len(profile_urls):
+            print(f"  Skipped {len(raw_urls) - len(profile_urls)} duplicate/malformed URLs")
     else:
         print(f"\nNo URLs file found. Creating sample at: {urls_file}")
         print("Add LinkedIn profile URLs (one per line) to this file and run again.")
@@ -411,19 +940,24 @@ def main():
         return
 
     # Scrape profiles
-    scraper = BulkProfileScraper(headless=False)
+    # Headless by default (much lower RSS); HEADFUL=1 shows the browser
+    scraper = BulkProfileScraper(headless=os.getenv("HEADFUL", "0") != "1")
 
     try:
-        profiles = scraper.scrape_multiple(profile_urls, max_profiles=100)
+        # Profiles are written to JSONL + CSV as they are scraped
+        if SCRAPE_CONCURRENCY > 1:
+            scraped = len(asyncio.run(scraper.scrape_multiple_async(profile_urls, max_profiles=100)))
+        else:
+            scraped = sum(1 for _ in scraper.iter_scrape(profile_urls, max_profiles=100))
 
-        # Export to CSV (always works)
-        if profiles:
+        if scraped:
             print("\n" + "=" * 60)
-            export_to_csv(profiles)
+            print(f"Exported {scraped} profiles to CSV:")
+            print(f"  {PROFILES_CSV}")
 
             # Try Google Sheets (may fail if quota exceeded)
             try:
-                export_to_google_sheet(profiles, "LinkedIn Scraped Profiles")
+                export_to_google_sheet(iter_scraped_profiles(), "LinkedIn Scraped Profiles")
             except Exception as e:
                 print(f"\nGoogle Sheets export failed: {e}")
                 print("Data has been saved to CSV file instead.")
@@ -13,28 +13,268 @@ Usage:
     python linkedin_agent.py message --csv profiles.csv --template "Hi {name}..."
     python linkedin_agent.py comment --hashtags "ai,automation" --count 10
     python linkedin_agent.py find-posts --hashtags "startup,entrepreneur"
+    python linkedin_agent.py daemon
+    python linkedin_agent.py --socket /tmp/li_agent.sock find-posts --hashtags "ai"
 """
 
 import argparse
+import asyncio
 import json
 import csv
+import functools
+import os
+import signal
+import socket
+import string
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import count, cycle, islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Sized
 
 # Setup path for imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
-from approach2_playwright.execution.linkedin_browser_auth import LinkedInAuth, get_authenticated_context
-from approach2_playwright.execution.anti_detection import AntiDetection, RateLimiter
+from approach2_playwright.execution.anti_detection import AntiDetection, RateLimiter, TokenBucket
 from shared.types import LinkedInProfile
 
+# linkedin_browser_auth and context_pool import Playwright, which a daemon
+# client never touches; see _browser_auth() / _context_pool_cls()
+if TYPE_CHECKING:
+    from approach2_playwright.execution.linkedin_browser_auth import LinkedInAuth
+
+# Optional: orjson is several times faster for the JSONL log and post dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BASE_DIR = Path(__file__).parent
 OUTPUT_DIR = BASE_DIR / ".tmp" / "agent_output"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Where `linkedin_agent.py daemon` listens (see serve())
+DAEMON_SOCKET = os.getenv("LINKEDIN_AGENT_SOCKET", "/tmp/li_agent.sock")
+
+PROFILE_CSV_HEADERS = ["Name", "Headline", "Location", "Connections", "Profile URL", "Scraped At"]
+
+AGENT_LOG_FILE = OUTPUT_DIR / "agent_log.jsonl"
+LEGACY_AGENT_LOG_FILE = OUTPUT_DIR / "agent_log.json"
+
+
+# Worker classes pull in Playwright and the scraping modules, so they're
+# imported on first use; functools.cache makes every later call a dict hit
+
+@functools.cache
+def _browser_auth():
+    from approach2_playwright.execution import linkedin_browser_auth
+    return linkedin_browser_auth
+
+
+@functools.cache
+def _context_pool_cls():
+    from approach2_playwright.execution.context_pool import ContextPool
+    return ContextPool
+
+
+@functools.cache
+def _poster_cls():
+    from approach2_playwright.execution.linkedin_content_poster import LinkedInContentPoster
+    return LinkedInContentPoster
+
+
+@functools.cache
+def _messenger_cls():
+    from approach2_playwright.execution.linkedin_messenger import LinkedInMessenger
+    return LinkedInMessenger
+
+
+@functools.cache
+def _finder_cls():
+    from approach2_playwright.execution.linkedin_post_finder import LinkedInPostFinder
+    return LinkedInPostFinder
+
+
+@functools.cache
+def _commenter_cls():
+    from approach2_playwright.execution.linkedin_commenter import LinkedInCommenter
+    return LinkedInCommenter
+
+
+@functools.cache
+def _search_scraper_cls():
+    from search_and_scrape import LinkedInSearchScraper
+    return LinkedInSearchScraper
+
+
+@functools.cache
+def _bulk_scraper_cls():
+    from bulk_scrape_to_sheet import BulkProfileScraper
+    return BulkProfileScraper
+
+
+def _json_line(obj) -> str:
+    """Serialize one JSONL record (trailing newline included)"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, default=str) + "\n"
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _profile_csv_row(p: dict) -> list:
+    """Flatten a profile dict into a row matching PROFILE_CSV_HEADERS"""
+    return [
+        p.get("name", ""),
+        p.get("headline", ""),
+        p.get("location", ""),
+        p.get("connections", ""),
+        p.get("profile_url", ""),
+        p.get("scraped_at", "")
+    ]
+
+
+def _compile_message_template(message_template: str) -> string.Template:
+    """
+    Convert {name}/{company}/{headline} to ${}-placeholders once, so each
+    row is a single substitution pass instead of three replace() scans.
+
+    The braced form keeps "{company}ers" or "{company}_HQ" from being read
+    as a longer identifier; any other "$" in the text is escaped.
+    """
+    return string.Template(
+        message_template.replace("$", "$$")
+        .replace("{name}", "${name}")
+        .replace("{company}", "${company}")
+        .replace("{headline}", "${headline}")
+    )
+
+
+def _collect(items: Iterable, sink: list) -> Iterator:
+    """Pass items through unchanged while appending each one to sink"""
+    for item in items:
+        sink.append(item)
+        yield item
+
+
+@dataclass
+class Session:
+    """
+    The Playwright objects behind one authenticated browser.
+
+    close() tears everything down in order and is safe to call twice or
+    after a partial failure: each handle is cleared as soon as it is dealt
+    with, so a retry never touches (or leaks) a half-closed browser.
+    """
+    playwright: Any = None
+    browser: Any = None
+    context: Any = None
+    auth: Optional["LinkedInAuth"] = None
+
+    @classmethod
+    def start(cls, headless: bool = False) -> "Session":
+        """Launch a browser and log in (reusing the saved session if valid)"""
+        playwright, browser, context, auth = _browser_auth().get_authenticated_context(headless)
+        return cls(playwright=playwright, browser=browser, context=context, auth=auth)
+
+    def close(self):
+        """Close auth, context, browser and playwright, ignoring individual failures"""
+        if self.auth is not None:
+            try:
+                # LinkedInAuth.close() shuts down everything it launched
+                self.auth.close()
+                self.playwright = self.browser = self.context = None
+            except Exception as e:
+                print(f"Warning: auth cleanup failed, closing handles directly: {e}")
+            self.auth = None
+
+        for attr, method in (("context", "close"), ("browser", "close"), ("playwright", "stop")):
+            obj = getattr(self, attr)
+            if obj is None:
+                continue
+            try:
+                getattr(obj, method)()
+            except Exception as e:
+                print(f"Warning: failed to {method} {attr}: {e}")
+            setattr(self, attr, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncBrowser:
+    """
+    One async Playwright browser + logged-in context, kept on a background
+    event loop for the agent's lifetime.
+
+    The sync Playwright API owns the agent's thread, so the async objects
+    live on their own loop thread; run() hands coroutines to it. The context
+    is created from the agent's live session with its user agent and
+    viewport, so concurrent scrapes look like the same browser.
+    """
+
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self.playwright = None
+        self.browser = None
+        self.context = None
+
+    def start(self, headless: bool, browser_args: list, **context_options):
+        """Start the loop thread, launch the browser and open the context"""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="agent-async-browser", daemon=True)
+        self._thread.start()
+        try:
+            self.run(self._launch(headless, browser_args, context_options))
+        except Exception:
+            self.close()
+            raise
+
+    async def _launch(self, headless: bool, browser_args: list, context_options: dict):
+        from playwright.async_api import async_playwright
+
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=headless, args=browser_args)
+        self.context = await self.browser.new_context(**context_options)
+
+    def run(self, coro):
+        """Run a coroutine on the browser's loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _shutdown(self):
+        for attr, method in (("context", "close"), ("browser", "close"), ("playwright", "stop")):
+            obj = getattr(self, attr)
+            if obj is None:
+                continue
+            try:
+                await getattr(obj, method)()
+            except Exception as e:
+                print(f"Warning: failed to {method} async {attr}: {e}")
+            setattr(self, attr, None)
+
+    def close(self):
+        """Close the context, browser and playwright, then stop the loop (idempotent)"""
+        if self.loop is None:
+            return
+        try:
+            self.run(self._shutdown())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self.loop = self._thread = None
+
 
 class LinkedInAgent:
     """
@@ -44,24 +284,167 @@ class LinkedInAgent:
 
     def __init__(self, headless: bool = False):
         self.headless = headless
-        self.playwright = None
-        self.browser = None
-        self.context = None
-        self.auth = None
+        self.session: Optional[Session] = None
+
+        # Workers bound to the shared context (created on first authentication)
+        self.poster = None
+        self.messenger = None
+        self.finder = None
+        self.commenter = None
+        self.pool = None
+
+        # Async browser for concurrent scrapes (started on first use, then
+        # kept warm like the sync session)
+        self.async_browser: Optional[AsyncBrowser] = None
+
+        # Token buckets pacing dispatch, keyed by action or "action:group"
+        self.buckets = {}
+
+        # Output files are named <prefix>_<batch_id>_<seq>, so batches run in
+        # the same second (or by concurrent agents) never overwrite each other
+        self.batch_id = f"{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}"
+        self._seq = count()
 
     def _ensure_authenticated(self):
-        """Ensure browser is authenticated"""
-        if not self.context:
-            self.playwright, self.browser, self.context, self.auth = get_authenticated_context(self.headless)
+        """
+        Ensure browser is authenticated.
+
+        One browser + logged-in context is launched per agent and shared by
+        every operation, so consecutive commands skip the cold start and login.
+        """
+        if self.session and self.session.context:
+            return
+
+        self.session = Session.start(self.headless)
+
+        shared = {
+            "context": self.context,
+            "anti_detection": self.auth.anti_detection,
+            "rate_limiter": self.auth.rate_limiter
+        }
+        self.poster = _poster_cls()(**shared)
+        self.messenger = _messenger_cls()(**shared)
+        self.finder = _finder_cls()(**shared)
+        self.commenter = _commenter_cls()(**shared)
+
+        # Extra contexts on the same browser for long-running jobs, so e.g.
+        # a bulk scrape and a messaging run don't clobber each other's tabs
+        viewport = self.auth.anti_detection.get_viewport_size()
+        self.pool = _context_pool_cls()(
+            self.browser,
+            size=int(os.getenv("CONTEXT_POOL_SIZE", "2")),
+            storage_state_path=str(_browser_auth().SESSION_FILE),
+            viewport={"width": viewport[0], "height": viewport[1]},
+            user_agent=self.auth.anti_detection.user_agent
+        )
+
+    def _async_context(self):
+        """
+        The agent's long-lived async BrowserContext, launched on first use.
+
+        Logged in from the sync context's current storage state, with the
+        same user agent and viewport as every other context of this agent.
+        """
+        self._ensure_authenticated()
+        if self.async_browser is None:
+            anti_detection = self.auth.anti_detection
+            viewport = anti_detection.get_viewport_size()
+            async_browser = AsyncBrowser()
+            async_browser.start(
+                self.headless,
+                anti_detection.get_browser_args(),
+                storage_state=self.context.storage_state(),
+                viewport={"width": viewport[0], "height": viewport[1]},
+                user_agent=anti_detection.user_agent
+            )
+            self.async_browser = async_browser
+        return self.async_browser.context
+
+    def _bucket(self, action: str, group: Optional[str] = None) -> TokenBucket:
+        """
+        Get the token bucket for an action (and optional endpoint/hashtag group).
+
+        Each bucket holds a per-hour burst (e.g. MESSAGE_BURST) and refills at
+        the daily limit spread over 24 hours, so a quiet queue drains quickly
+        and a long one is spread out instead of sleeping a fixed gap every time.
+        """
+        key = f"{action}:{group}" if group else action
+        if key not in self.buckets:
+            limiter = self.auth.rate_limiter
+            daily = {
+                "messages": limiter.messages_per_day,
+                "connections": limiter.messages_per_day,
+                "comments": limiter.comments_per_day,
+                "profiles": limiter.actions_per_hour * 24
+            }[action]
+            burst = int(os.getenv(f"{action[:-1].upper()}_BURST", "5"))
+            self.buckets[key] = TokenBucket.per_day(daily, burst)
+        return self.buckets[key]
+
+    def _pace(self, buckets: List[TokenBucket], last_action: Optional[float]) -> float:
+        """
+        Wait until the next outward action may go out, then take its tokens.
+
+        Sleeps once, for whichever is longer: the time until every bucket
+        has a token, or what's left of a human-like jittered gap since the
+        previous action. The two never stack, unlike sleeping after each
+        action and then blocking on the rate limiter too.
+
+        Args:
+            buckets: Buckets the action draws from
+            last_action: time.monotonic() of the previous action (None if first)
+
+        Returns:
+            time.monotonic() after the tokens were taken, for the next call
+        """
+        since_last = time.monotonic() - last_action if last_action is not None else float("inf")
+        wait = max(
+            max(b.time_until_token() for b in buckets),
+            self.auth.anti_detection.next_delay() - since_last
+        )
+        if wait > 0:
+            time.sleep(wait)
+
+        for bucket in buckets:
+            bucket.acquire()
+        return time.monotonic()
+
+    def _output_path(self, prefix: str, suffix: str) -> Path:
+        """Unique file in OUTPUT_DIR for this batch, e.g. scraped_profiles_<batch>_0.csv"""
+        return OUTPUT_DIR / f"{prefix}_{self.batch_id}_{next(self._seq)}{suffix}"
+
+    # Shortcuts into the current session (None before authentication)
+
+    @property
+    def playwright(self):
+        return self.session.playwright if self.session else None
+
+    @property
+    def browser(self):
+        return self.session.browser if self.session else None
+
+    @property
+    def context(self):
+        return self.session.context if self.session else None
+
+    @property
+    def auth(self) -> Optional["LinkedInAuth"]:
+        return self.session.auth if self.session else None
 
     def close(self):
-        """Close browser and cleanup"""
-        if self.auth:
-            self.auth.close()
-            self.auth = None
-            self.context = None
-            self.browser = None
-            self.playwright = None
+        """Close browser and cleanup (idempotent; safe after a failed close)"""
+        try:
+            if self.async_browser:
+                async_browser, self.async_browser = self.async_browser, None
+                async_browser.close()
+            if self.pool:
+                self.pool.close()
+        finally:
+            self.pool = None
+            self.poster = self.messenger = self.finder = self.commenter = None
+            if self.session:
+                session, self.session = self.session, None
+                session.close()
 
     # =========================================================================
     # SCRAPING
@@ -84,50 +467,68 @@ class LinkedInAgent:
         Returns:
             List of scraped profile dicts
         """
-        from search_and_scrape import LinkedInSearchScraper
-
-        scraper = LinkedInSearchScraper(headless=self.headless)
-
-        try:
-            # Start browser and login
-            scraper.start_browser()
-
-            # Search for profiles using each search term
-            print(f"Searching for profiles: {search_terms}")
-            all_profile_urls = []
-
-            for term in search_terms:
-                urls = scraper.search_profiles(term, max_results=max_profiles)
-                all_profile_urls.extend(urls)
-
-            # Deduplicate
-            profile_urls = list(dict.fromkeys(all_profile_urls))
-
-            if not profile_urls:
-                print("No profiles found")
-                return []
-
-            print(f"Found {len(profile_urls)} unique profile URLs")
+        LinkedInSearchScraper = _search_scraper_cls()
 
-            # Scrape profiles (limit to max_profiles)
-            profiles = scraper.scrape_profiles(profile_urls[:max_profiles])
-
-            # Export to CSV
-            csv_file = output_csv or f"scraped_profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            csv_path = OUTPUT_DIR / csv_file
-
-            self._export_profiles_to_csv(profiles, csv_path)
-            print(f"\nExported {len(profiles)} profiles to: {csv_path}")
+        self._ensure_authenticated()
 
-            return profiles
+        with self.pool.acquire() as ctx:
+            scraper = LinkedInSearchScraper(
+                headless=self.headless,
+                context=ctx,
+                anti_detection=self.auth.anti_detection,
+                rate_limiter=self.auth.rate_limiter
+            )
 
-        finally:
-            scraper.close()
+            try:
+                # Search for profiles using each search term
+                print(f"Searching for profiles: {search_terms}")
+                # Dedupe as URLs arrive and stop searching once we have enough
+                seen = set()
+                profile_urls = []
+
+                for term in search_terms:
+                    for url in scraper.search_profiles(term, max_results=max_profiles):
+                        if url not in seen:
+                            seen.add(url)
+                            profile_urls.append(url)
+                            if len(profile_urls) >= max_profiles:
+                                break
+                    if len(profile_urls) >= max_profiles:
+                        break
+
+                if not profile_urls:
+                    print("No profiles found")
+                    return []
+
+                print(f"Found {len(profile_urls)} unique profile URLs")
+
+                # Concurrent scraping (opt-in) runs on the agent's warm async
+                # context rather than a browser launched for this call
+                from search_and_scrape import SCRAPE_CONCURRENCY
+                if SCRAPE_CONCURRENCY > 1 and len(profile_urls) > 1:
+                    async_ctx = self._async_context()
+                    profiles = self.async_browser.run(
+                        scraper.scrape_profiles_async(profile_urls, SCRAPE_CONCURRENCY, context=async_ctx)
+                    )
+                else:
+                    profiles = scraper.scrape_profiles(profile_urls, concurrency=1)
+
+                # Export to CSV
+                csv_path = OUTPUT_DIR / output_csv if output_csv else self._output_path("scraped_profiles", ".csv")
+
+                self._export_profiles_to_csv(profiles, csv_path)
+                print(f"\nExported {len(profiles)} profiles to: {csv_path}")
+
+                return profiles
+
+            finally:
+                scraper.close()
 
     def scrape_profiles_from_urls(
         self,
         profile_urls: List[str],
-        output_csv: str = None
+        output_csv: str = None,
+        concurrency: int = None
     ) -> List[dict]:
         """
         Scrape specific profile URLs.
@@ -135,22 +536,43 @@ class LinkedInAgent:
         Args:
             profile_urls: List of LinkedIn profile URLs
             output_csv: Output CSV filename
+            concurrency: Profile pages loaded at once (default
+                search_and_scrape.SCRAPE_CONCURRENCY, 1); 1 scrapes
+                sequentially on the shared context
 
         Returns:
             List of scraped profile dicts
         """
-        from bulk_scrape_to_sheet import BulkProfileScraper
-
-        scraper = BulkProfileScraper(headless=self.headless)
+        BulkProfileScraper = _bulk_scraper_cls()
 
-        try:
-            profiles = scraper.scrape_multiple(profile_urls)
+        if concurrency is None:
+            from search_and_scrape import SCRAPE_CONCURRENCY
+            concurrency = SCRAPE_CONCURRENCY
 
-            # Export to CSV
-            csv_file = output_csv or f"scraped_profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            csv_path = OUTPUT_DIR / csv_file
+        self._ensure_authenticated()
+        scraper = BulkProfileScraper(
+            headless=self.headless,
+            context=self.context,
+            anti_detection=self.auth.anti_detection,
+            rate_limiter=self.auth.rate_limiter
+        )
 
-            self._export_profiles_to_csv(profiles, csv_path)
+        try:
+            csv_path = OUTPUT_DIR / output_csv if output_csv else self._output_path("scraped_profiles", ".csv")
+
+            if concurrency > 1:
+                # Opt-in: K pages at once on the agent's warm async context
+                context = self._async_context()
+                profiles = self.async_browser.run(
+                    self._scrape_urls_async(scraper, profile_urls, csv_path, concurrency, context)
+                )
+            else:
+                # Rows hit the CSV as each profile is scraped
+                profiles = []
+                self._export_profiles_to_csv(
+                    _collect(scraper.iter_scrape(profile_urls), profiles),
+                    csv_path
+                )
             print(f"\nExported {len(profiles)} profiles to: {csv_path}")
 
             return profiles
@@ -158,23 +580,77 @@ class LinkedInAgent:
         finally:
             scraper.close()
 
-    def _export_profiles_to_csv(self, profiles: List[dict], csv_path: Path):
-        """Export profiles to CSV"""
-        headers = ["Name", "Headline", "Location", "Connections", "Profile URL", "Scraped At"]
+    async def _scrape_urls_async(
+        self,
+        scraper,
+        profile_urls: List[str],
+        csv_path: Path,
+        concurrency: int,
+        context
+    ) -> List[dict]:
+        """
+        Scrape up to `concurrency` profiles at once, writing each CSV row as
+        soon as its page finishes. Every navigation first takes a token from
+        the "profiles" bucket.
+        """
+        profiles = []
 
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(headers)
+            writer.writerow(PROFILE_CSV_HEADERS)
+
+            async for profile in scraper.iter_scrape_async(
+                profile_urls,
+                max_profiles=len(profile_urls),
+                concurrency=concurrency,
+                bucket=self._bucket("profiles"),
+                context=context
+            ):
+                writer.writerow(_profile_csv_row(profile))
+                f.flush()
+                profiles.append(profile)
+                print(f"[{len(profiles)}/{len(profile_urls)}] {profile.get('name', '')[:40]}")
 
+        return profiles
+
+    def _export_profiles_to_csv(
+        self,
+        profiles: Iterable[dict],
+        csv_path: Path
+    ) -> int:
+        """
+        Export profiles to CSV in a single writerows() call.
+
+        Rows from a live iterator (e.g. a scrape generator) are flushed one
+        by one, so a crash keeps everything scraped so far; a list of
+        already-scraped profiles goes out in large buffered writes.
+
+        Args:
+            profiles: Any iterable of profile dicts (e.g. a live scrape generator)
+            csv_path: Output file
+
+        Returns:
+            Number of rows written
+        """
+        count = 0
+        live = not isinstance(profiles, Sized)
+
+        def rows():
+            nonlocal count
             for p in profiles:
-                writer.writerow([
-                    p.get("name", ""),
-                    p.get("headline", ""),
-                    p.get("location", ""),
-                    p.get("connections", ""),
-                    p.get("profile_url", ""),
-                    p.get("scraped_at", "")
-                ])
+                count += 1
+                yield _profile_csv_row(p)
+                # Resumed once writerows() has buffered the row above, and
+                # before waiting on the next profile
+                if live:
+                    f.flush()
+
+        with open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(PROFILE_CSV_HEADERS)
+            writer.writerows(rows())
+
+        return count
 
     # =========================================================================
     # POST CREATION
@@ -197,14 +673,9 @@ class LinkedInAgent:
         Returns:
             Dict with success status
         """
-        from approach2_playwright.execution.linkedin_content_poster import create_post
+        self._ensure_authenticated()
 
-        result = create_post(
-            content=content,
-            hashtags=hashtags,
-            media_paths=media_paths,
-            headless=self.headless
-        )
+        result = self.poster.create_post(content, hashtags, media_paths)
 
         self._log_action("post_created", {
             "content": content[:100],
@@ -233,13 +704,9 @@ class LinkedInAgent:
         Returns:
             Dict with success status
         """
-        from approach2_playwright.execution.linkedin_messenger import send_connection_request
+        self._ensure_authenticated()
 
-        result = send_connection_request(
-            profile_url=profile_url,
-            note=note,
-            headless=self.headless
-        )
+        result = self.messenger.send_connection_request(profile_url, note)
 
         self._log_action("connection_request", {
             "profile_url": profile_url,
@@ -264,13 +731,9 @@ class LinkedInAgent:
         Returns:
             Dict with success status
         """
-        from approach2_playwright.execution.linkedin_messenger import send_message
+        self._ensure_authenticated()
 
-        result = send_message(
-            profile_url=profile_url,
-            message=message,
-            headless=self.headless
-        )
+        result = self.messenger.send_message(profile_url, message)
 
         self._log_action("message_sent", {
             "profile_url": profile_url,
@@ -301,61 +764,114 @@ class LinkedInAgent:
         """
         self._ensure_authenticated()
 
-        from approach2_playwright.execution.linkedin_messenger import LinkedInMessenger
-
-        messenger = LinkedInMessenger(
-            context=self.context,
-            anti_detection=self.auth.anti_detection,
-            rate_limiter=self.auth.rate_limiter
-        )
-
-        # Load profiles from CSV
-        profiles = self._load_profiles_from_csv(profiles_csv)
-
-        if not profiles:
-            return [{"error": "No profiles loaded from CSV"}]
-
-        results = []
-
-        for i, profile in enumerate(profiles[:max_messages]):
-            if not self.auth.rate_limiter.can_send_message():
-                print("Daily message limit reached")
-                break
-
-            # Personalize message
-            first_name = profile.get("name", "").split()[0] if profile.get("name") else "there"
-            message = message_template.replace("{name}", first_name)
-            message = message.replace("{company}", profile.get("company", "your company"))
-            message = message.replace("{headline}", profile.get("headline", ""))
-
-            profile_url = profile.get("profile_url", "")
-
-            print(f"[{i+1}/{min(len(profiles), max_messages)}] Messaging: {profile.get('name', profile_url)}")
-
-            if connection_request:
-                result = messenger.send_connection_request(profile_url, message[:300])
-            else:
-                result = messenger.send_message(profile_url, message)
-
-            result["profile_name"] = profile.get("name", "")
-            results.append(result)
+        LinkedInMessenger = _messenger_cls()
 
-            # Wait between messages
-            self.auth.anti_detection.long_wait()
+        with self.pool.acquire() as ctx:
+            messenger = LinkedInMessenger(
+                context=ctx,
+                anti_detection=self.auth.anti_detection,
+                rate_limiter=self.auth.rate_limiter
+            )
 
-        # Log results
+            # Skip anyone a previous run already reached, before they count
+            # against max_messages or cost a page load
+            already = self._already_messaged()
+            skipped = 0
+
+            def fresh_profiles():
+                nonlocal skipped
+                for profile in self._iter_profiles_from_csv(profiles_csv):
+                    if profile["profile_url"] in already:
+                        skipped += 1
+                        continue
+                    yield profile
+
+            # Stream profiles from CSV - the first message goes out before
+            # the rest of the file is parsed
+            profiles = islice(fresh_profiles(), max_messages)
+
+            template = _compile_message_template(message_template)
+
+            results = []
+            successful = 0
+            loaded = 0
+            last_action = None
+            bucket = self._bucket("connections" if connection_request else "messages")
+
+            for i, profile in enumerate(profiles):
+                loaded += 1
+
+                if not self.auth.rate_limiter.can_send_message():
+                    print("Daily message limit reached")
+                    break
+
+                # _iter_profiles_from_csv fills every key, so index directly
+                name, headline, company, profile_url = (
+                    profile["name"], profile["headline"], profile["company"], profile["profile_url"]
+                )
+
+                # Personalize message
+                message = template.safe_substitute(
+                    name=name.split()[0] if name else "there",
+                    company=company,
+                    headline=headline
+                )
+
+                last_action = self._pace([bucket], last_action)
+
+                # No total: the CSV is streamed and already-messaged rows are
+                # filtered out, so max_messages is only an upper bound
+                print(f"[{i+1}/≤{max_messages}] Messaging: {name or profile_url}")
+
+                if connection_request:
+                    action = "connection_request"
+                    result = messenger.send_connection_request(profile_url, message[:300])
+                else:
+                    action = "message_sent"
+                    result = messenger.send_message(profile_url, message)
+
+                result["profile_name"] = name
+                results.append(result)
+                if result.get("success"):
+                    successful += 1
+                    # Logged per send, so a crash or limit stop later in the
+                    # run can't make the next run message this profile again
+                    self._log_action(action, {"profile_url": profile_url, "result": result})
+
+            if skipped:
+                print(f"Skipped {skipped} already-messaged profiles")
+
+            if not loaded:
+                if skipped:
+                    return [{"error": "All profiles in CSV were already messaged"}]
+                return [{"error": "No profiles loaded from CSV"}]
+
+        # Run summary (reporting only; _already_messaged reads the per-send entries)
         self._log_action("bulk_messages", {
             "total_attempted": len(results),
-            "successful": sum(1 for r in results if r.get("success")),
-            "failed": sum(1 for r in results if not r.get("success"))
+            "successful": successful,
+            "failed": len(results) - successful,
+            "skipped": skipped
         })
 
         return results
 
-    def _load_profiles_from_csv(self, csv_path: str) -> List[dict]:
-        """Load profiles from CSV file"""
-        profiles = []
-
+    def _already_messaged(self) -> set:
+        """
+        Profile URLs that were successfully messaged or sent a connection
+        request in any earlier run, read in one pass over the agent log.
+        """
+        seen = set()
+        for entry in read_log():
+            action = entry.get("action")
+            data = entry.get("data") or {}
+            if action in ("message_sent", "connection_request"):
+                if (data.get("result") or {}).get("success"):
+                    seen.add(data.get("profile_url"))
+        return seen
+
+    def _iter_profiles_from_csv(self, csv_path: str) -> Iterator[dict]:
+        """Yield profiles from CSV file one row at a time"""
         with open(csv_path, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             for row in reader:
@@ -368,9 +884,7 @@ class LinkedInAgent:
                     "location": row.get("Location") or row.get("location", "")
                 }
                 if profile["profile_url"]:
-                    profiles.append(profile)
-
-        return profiles
+                    yield profile
 
     # =========================================================================
     # COMMENTING
@@ -395,23 +909,24 @@ class LinkedInAgent:
         Returns:
             List of found posts
         """
-        from approach2_playwright.execution.linkedin_post_finder import find_posts
-
-        result = find_posts(
-            hashtags=hashtags,
-            keywords=keywords,
-            include_feed=include_feed,
-            max_per_source=max_posts,
-            headless=self.headless
-        )
-
-        # Convert posts to dicts
-        posts = [p.to_dict() for p in result.posts]
+        self._ensure_authenticated()
 
-        # Save to file
-        output_file = OUTPUT_DIR / f"found_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, "w") as f:
-            json.dump(posts, f, indent=2, default=str)
+        # One JSON object per line, written as each post is found; a crash
+        # leaves every complete line readable (see ndjson_to_json())
+        output_file = self._output_path("found_posts", ".jsonl")
+        posts = []
+
+        with open(output_file, "w", encoding="utf-8") as f:
+            for post in self.finder.iter_posts(
+                hashtags=hashtags,
+                keywords=keywords,
+                include_feed=include_feed,
+                max_per_source=max_posts
+            ):
+                d = post.to_dict()
+                f.write(_json_line(d))
+                f.flush()
+                posts.append(d)
 
         print(f"Found {len(posts)} posts, saved to: {output_file}")
 
@@ -432,13 +947,9 @@ class LinkedInAgent:
         Returns:
             Dict with success status
         """
-        from approach2_playwright.execution.linkedin_commenter import post_comment
+        self._ensure_authenticated()
 
-        result = post_comment(
-            post_url=post_url,
-            comment=comment,
-            headless=self.headless
-        )
+        result = self.commenter.post_comment(post_url, comment)
 
         self._log_action("comment_posted", {
             "post_url": post_url,
@@ -467,50 +978,57 @@ class LinkedInAgent:
         """
         self._ensure_authenticated()
 
-        from approach2_playwright.execution.linkedin_post_finder import LinkedInPostFinder
-        from approach2_playwright.execution.linkedin_commenter import LinkedInCommenter
+        LinkedInCommenter = _commenter_cls()
 
-        finder = LinkedInPostFinder(
-            context=self.context,
-            anti_detection=self.auth.anti_detection,
-            rate_limiter=self.auth.rate_limiter
-        )
-
-        commenter = LinkedInCommenter(
-            context=self.context,
-            anti_detection=self.auth.anti_detection,
-            rate_limiter=self.auth.rate_limiter
-        )
-
-        # Find posts
-        all_posts = []
-        for tag in hashtags:
-            print(f"Finding posts with #{tag}...")
-            posts = finder.find_posts_by_hashtag(tag, max_posts=max_comments)
-            all_posts.extend(posts)
-            self.auth.anti_detection.medium_wait()
-
-        if not all_posts:
-            return [{"error": "No posts found"}]
-
-        # Comment on posts
-        results = []
-
-        for i, post in enumerate(all_posts[:max_comments]):
-            if not self.auth.rate_limiter.can_post_comment():
-                print("Daily comment limit reached")
-                break
-
-            comment = comments[i % len(comments)]
-
-            print(f"[{i+1}/{min(len(all_posts), max_comments)}] Commenting on {post.author_name}'s post")
-
-            result = commenter.post_comment(post.post_url, comment)
-            result["post_author"] = post.author_name
-            result["post_content"] = post.content[:100]
-            results.append(result)
+        with self.pool.acquire() as ctx:
+            commenter = LinkedInCommenter(
+                context=ctx,
+                anti_detection=self.auth.anti_detection,
+                rate_limiter=self.auth.rate_limiter
+            )
 
-            self.auth.anti_detection.long_wait()
+            # Find posts, one hashtag at a time on the pooled context. Sync
+            # Playwright objects are tied to this thread, and extra browsers
+            # on the same session would show LinkedIn several fingerprints
+            finder = _finder_cls()(
+                context=ctx,
+                anti_detection=self.auth.anti_detection,
+                rate_limiter=self.auth.rate_limiter
+            )
+            all_posts = []
+            for tag in hashtags:
+                print(f"Finding posts with #{tag}...")
+                posts = finder.find_posts_by_hashtag(tag, max_posts=max_comments)
+                all_posts.extend((tag, post) for post in posts)
+                self.auth.anti_detection.medium_wait()
+
+            if not all_posts:
+                return [{"error": "No posts found"}]
+
+            # Comment on posts
+            results = []
+            targets = all_posts[:max_comments]
+            total = len(targets)
+            last_action = None
+
+            for i, ((tag, post), comment) in enumerate(zip(targets, cycle(comments))):
+                if not self.auth.rate_limiter.can_post_comment():
+                    print("Daily comment limit reached")
+                    break
+
+                # Global comment budget plus a per-hashtag one, so a single
+                # busy tag can't take the whole burst
+                last_action = self._pace(
+                    [self._bucket("comments"), self._bucket("comments", group=tag)],
+                    last_action
+                )
+
+                print(f"[{i+1}/{total}] Commenting on {post.author_name}'s post")
+
+                result = commenter.post_comment(post.post_url, comment)
+                result["post_author"] = post.author_name
+                result["post_content"] = post.content[:100]
+                results.append(result)
 
         # Log results
         self._log_action("auto_comment", {
@@ -527,22 +1045,105 @@ class LinkedInAgent:
     # =========================================================================
 
     def _log_action(self, action_type: str, data: dict):
-        """Log an action to the agent log"""
-        log_file = OUTPUT_DIR / "agent_log.json"
-
-        log_entries = []
-        if log_file.exists():
-            with open(log_file) as f:
-                log_entries = json.load(f)
+        """Append an action to the agent log (one JSON object per line)"""
+        _migrate_legacy_log()
 
-        log_entries.append({
+        entry = {
             "action": action_type,
             "data": data,
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": datetime.now().isoformat(),
+            "batch_id": self.batch_id
+        }
 
-        with open(log_file, "w") as f:
-            json.dump(log_entries, f, indent=2, default=str)
+        with open(AGENT_LOG_FILE, "a", encoding="utf-8") as f:
+            f.write(_json_line(entry))
+
+
+def read_log(log_file: Path = None) -> Iterator[dict]:
+    """Yield agent log entries oldest-first without loading the whole file"""
+    _migrate_legacy_log()
+    log_file = log_file or AGENT_LOG_FILE
+    if not log_file.exists():
+        return
+
+    with open(log_file, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
+
+
+def _migrate_legacy_log():
+    """Convert a pre-JSONL agent_log.json (one big array) to agent_log.jsonl"""
+    if not LEGACY_AGENT_LOG_FILE.exists():
+        return
+
+    with open(LEGACY_AGENT_LOG_FILE, encoding="utf-8") as f:
+        entries = _json_loads(f.read())
+
+    # Build the merged log beside the real one and swap it in, so a crash
+    # mid-migration never leaves a half-written agent_log.jsonl
+    tmp = AGENT_LOG_FILE.with_suffix(".jsonl.tmp")
+    with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for entry in entries:
+            f.write(_json_line(entry))
+        if AGENT_LOG_FILE.exists():
+            with open(AGENT_LOG_FILE, encoding="utf-8") as existing:
+                for line in existing:
+                    f.write(line)
+    os.replace(tmp, AGENT_LOG_FILE)
+
+    LEGACY_AGENT_LOG_FILE.unlink()
+
+
+def ndjson_to_json(ndjson_file: Path, json_file: Path = None) -> Path:
+    """
+    Convert an NDJSON file (e.g. found_posts_*.jsonl) to a pretty-printed
+    JSON array for tools that want one.
+
+    Returns:
+        Path of the written JSON file (defaults to ndjson_file with .json)
+    """
+    ndjson_file = Path(ndjson_file)
+    json_file = Path(json_file) if json_file else ndjson_file.with_suffix(".json")
+
+    with open(ndjson_file, encoding="utf-8") as f:
+        records = [_json_loads(line) for line in f if line.strip()]
+
+    _write_json_atomic(json_file, records)
+    return json_file
+
+
+def _write_json_atomic(path: Path, data):
+    """
+    Write JSON to a temp file and os.replace() it over path.
+
+    Readers see either the old file or the complete new one, never a
+    truncated dump; the large buffer turns json.dump's many small writes
+    into a few big ones.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(data, f, indent=2, default=str)
+    os.replace(tmp, path)
+
+
+def csv_list(value: str) -> Optional[List[str]]:
+    """argparse type: split a comma-separated option into stripped, non-empty items"""
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def hashtag_list(value: str) -> Optional[List[str]]:
+    """argparse type: like csv_list(), also dropping any leading '#'"""
+    items = csv_list(value)
+    if items is None:
+        return None
+    return [item.lstrip("#") for item in items if item.lstrip("#")]
 
 
 def main():
@@ -566,6 +1167,10 @@ Examples:
 
   Find posts to review:
     python linkedin_agent.py find-posts --hashtags ai,ml --keywords "machine learning"
+
+  Keep a warm browser running and send commands to it:
+    python linkedin_agent.py --headless daemon
+    python linkedin_agent.py --socket /tmp/li_agent.sock find-posts --hashtags ai,ml
         """
     )
 
@@ -573,7 +1178,7 @@ Examples:
 
     # Scrape command
     scrape_parser = subparsers.add_parser("scrape", help="Scrape LinkedIn profiles")
-    scrape_parser.add_argument("--search", type=str, help="Search terms (comma-separated)")
+    scrape_parser.add_argument("--search", type=csv_list, help="Search terms (comma-separated)")
     scrape_parser.add_argument("--urls", type=str, help="File with profile URLs (one per line)")
     scrape_parser.add_argument("--count", type=int, default=50, help="Max profiles to scrape")
     scrape_parser.add_argument("--output", type=str, help="Output CSV filename")
@@ -581,8 +1186,8 @@ Examples:
     # Post command
     post_parser = subparsers.add_parser("post", help="Create a LinkedIn post")
     post_parser.add_argument("--content", type=str, required=True, help="Post content")
-    post_parser.add_argument("--hashtags", type=str, help="Hashtags (comma-separated)")
-    post_parser.add_argument("--media", type=str, help="Media file paths (comma-separated)")
+    post_parser.add_argument("--hashtags", type=hashtag_list, help="Hashtags (comma-separated)")
+    post_parser.add_argument("--media", type=csv_list, help="Media file paths (comma-separated)")
 
     # Message command
     msg_parser = subparsers.add_parser("message", help="Send messages/connection requests")
@@ -593,18 +1198,25 @@ Examples:
 
     # Comment command
     comment_parser = subparsers.add_parser("comment", help="Auto-comment on posts")
-    comment_parser.add_argument("--hashtags", type=str, required=True, help="Hashtags to search (comma-separated)")
-    comment_parser.add_argument("--comments", type=str, required=True, help="Comments to use (comma-separated)")
+    comment_parser.add_argument("--hashtags", type=hashtag_list, required=True, help="Hashtags to search (comma-separated)")
+    comment_parser.add_argument("--comments", type=csv_list, required=True, help="Comments to use (comma-separated)")
     comment_parser.add_argument("--max", type=int, default=10, help="Max comments to post")
 
     # Find posts command
     find_parser = subparsers.add_parser("find-posts", help="Find posts to engage with")
-    find_parser.add_argument("--hashtags", type=str, help="Hashtags to search (comma-separated)")
-    find_parser.add_argument("--keywords", type=str, help="Keywords to search (comma-separated)")
+    find_parser.add_argument("--hashtags", type=hashtag_list, help="Hashtags to search (comma-separated)")
+    find_parser.add_argument("--keywords", type=csv_list, help="Keywords to search (comma-separated)")
     find_parser.add_argument("--max", type=int, default=20, help="Max posts per source")
 
+    # Daemon command
+    subparsers.add_parser("daemon", help="Keep one agent running and serve commands over a Unix socket")
+
     # Global args
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
+    parser.add_argument(
+        "--socket", type=str,
+        help=f"Daemon socket: where `daemon` listens (default {DAEMON_SOCKET}), or send the command to it"
+    )
 
     args = parser.parse_args()
 
@@ -612,54 +1224,158 @@ Examples:
         parser.print_help()
         return
 
+    if args.command == "daemon":
+        asyncio.run(serve(args.socket or DAEMON_SOCKET, headless=args.headless))
+        return
+
+    if args.socket:
+        response = send_to_daemon(args.socket, args)
+        if "error" in response:
+            print(f"Daemon error: {response['error']}")
+        else:
+            _print_result(args, response["result"])
+        return
+
     agent = LinkedInAgent(headless=args.headless)
 
     try:
-        if args.command == "scrape":
-            if args.search:
-                search_terms = [t.strip() for t in args.search.split(",")]
-                agent.scrape_profiles_from_search(search_terms, args.count, args.output)
-            elif args.urls:
-                with open(args.urls) as f:
-                    urls = [line.strip() for line in f if line.strip()]
-                agent.scrape_profiles_from_urls(urls, args.output)
-            else:
-                print("Error: Provide --search or --urls")
-
-        elif args.command == "post":
-            hashtags = [t.strip() for t in args.hashtags.split(",")] if args.hashtags else None
-            media = [p.strip() for p in args.media.split(",")] if args.media else None
-            result = agent.create_post(args.content, hashtags, media)
-            print(f"Result: {result}")
-
-        elif args.command == "message":
-            results = agent.send_bulk_messages(
-                profiles_csv=args.csv,
-                message_template=args.template,
-                max_messages=args.max,
-                connection_request=not args.direct
-            )
-            successful = sum(1 for r in results if r.get("success"))
-            print(f"\nSent {successful}/{len(results)} messages successfully")
-
-        elif args.command == "comment":
-            hashtags = [t.strip() for t in args.hashtags.split(",")]
-            comments = [c.strip() for c in args.comments.split(",")]
-            results = agent.auto_comment(hashtags, comments, args.max)
-            successful = sum(1 for r in results if r.get("success"))
-            print(f"\nPosted {successful}/{len(results)} comments successfully")
-
-        elif args.command == "find-posts":
-            hashtags = [t.strip() for t in args.hashtags.split(",")] if args.hashtags else None
-            keywords = [k.strip() for k in args.keywords.split(",")] if args.keywords else None
-            posts = agent.find_posts(hashtags, keywords, max_posts=args.max)
-            print(f"\nFound {len(posts)} posts")
-            for p in posts[:5]:
-                print(f"  - {p.get('author_name', 'Unknown')}: {p.get('content', '')[:60]}...")
-
+        _print_result(args, _run_command(agent, args))
     finally:
         agent.close()
 
 
+def _run_command(agent: LinkedInAgent, args: argparse.Namespace):
+    """Run one parsed CLI command against an agent and return its raw result"""
+    if args.command == "scrape":
+        if args.search:
+            return agent.scrape_profiles_from_search(args.search, args.count, args.output)
+        elif args.urls:
+            with open(args.urls) as f:
+                urls = [line.strip() for line in f if line.strip()]
+            return agent.scrape_profiles_from_urls(urls, args.output)
+        else:
+            print("Error: Provide --search or --urls")
+
+    elif args.command == "post":
+        return agent.create_post(args.content, args.hashtags, args.media)
+
+    elif args.command == "message":
+        return agent.send_bulk_messages(
+            profiles_csv=args.csv,
+            message_template=args.template,
+            max_messages=args.max,
+            connection_request=not args.direct
+        )
+
+    elif args.command == "comment":
+        return agent.auto_comment(args.hashtags, args.comments, args.max)
+
+    elif args.command == "find-posts":
+        return agent.find_posts(args.hashtags, args.keywords, max_posts=args.max)
+
+
+def _print_result(args: argparse.Namespace, result):
+    """Print the CLI summary for a command's result"""
+    if result is None:
+        return
+
+    if args.command == "post":
+        print(f"Result: {result}")
+
+    elif args.command == "message":
+        successful = sum(1 for r in result if r.get("success"))
+        print(f"\nSent {successful}/{len(result)} messages successfully")
+
+    elif args.command == "comment":
+        successful = sum(1 for r in result if r.get("success"))
+        print(f"\nPosted {successful}/{len(result)} comments successfully")
+
+    elif args.command == "find-posts":
+        print(f"\nFound {len(result)} posts")
+        for p in result[:5]:
+            print(f"  - {p.get('author_name', 'Unknown')}: {p.get('content', '')[:60]}...")
+
+
+# =============================================================================
+# DAEMON MODE
+# =============================================================================
+
+async def serve(socket_path: str = DAEMON_SOCKET, headless: bool = False):
+    """
+    Keep one LinkedInAgent alive and run commands sent over a Unix socket.
+
+    Each request is one JSON line {"cmd": ..., "args": {...}} holding the
+    client's parsed CLI arguments; the reply is one JSON line with either
+    "result" or "error". The browser, login, context pool, async browser
+    (concurrent scrapes) and token buckets all survive between commands, so
+    warm commands, scrapes included, skip the Chromium launch.
+
+    The sync Playwright API can't run inside an event loop and is bound to
+    the thread that started it, so every agent call goes through a single
+    worker thread (which also runs commands one at a time).
+    """
+    agent = LinkedInAgent(headless=headless)
+    worker = ThreadPoolExecutor(max_workers=1)
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    args = argparse.Namespace(**request["args"])
+                    args.command = request["cmd"]
+                    result = await loop.run_in_executor(worker, _run_command, agent, args)
+                    response = {"result": result}
+                except Exception as e:
+                    response = {"error": str(e)}
+                writer.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = await asyncio.start_unix_server(handle, socket_path)
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"LinkedIn agent daemon listening on {socket_path}")
+
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        await loop.run_in_executor(worker, agent.close)
+        worker.shutdown()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("LinkedIn agent daemon stopped")
+
+
+def send_to_daemon(socket_path: str, args: argparse.Namespace) -> dict:
+    """Send one parsed CLI command to a running daemon and return its reply"""
+    fields = {k: v for k, v in vars(args).items() if k not in ("command", "socket")}
+
+    # The daemon opens input files relative to its own cwd, not ours
+    for key in ("urls", "csv"):
+        if fields.get(key):
+            fields[key] = str(Path(fields[key]).resolve())
+    if fields.get("media"):
+        fields["media"] = [str(Path(m).resolve()) for m in fields["media"]]
+
+    request = {"cmd": args.command, "args": fields}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as f:
+            return json.loads(f.readline())
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,48 +3,204 @@ LinkedIn Search and Bulk Scrape
 Searches for profiles by keyword and scrapes them
 """
 
+import asyncio
 import json
 import time
 import csv
 import sys
-import re
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
 
 # Setup paths
 BASE_DIR = Path(__file__).parent
 sys.path.insert(0, str(BASE_DIR))
 sys.path.insert(0, str(BASE_DIR / "approach2_playwright" / "execution"))
 
-from approach2_playwright.execution.anti_detection import AntiDetection, RateLimiter
+# anti_detection pulls in numpy + fake_useragent; it's imported when a scraper
+# is built, not at module load (Playwright likewise inside start_browser)
+if TYPE_CHECKING:
+    from approach2_playwright.execution.anti_detection import AntiDetection, RateLimiter
+
 from dotenv import load_dotenv
 import os
 
-# Load env
+# Optional: orjson is several times faster for the final profile dump
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Load env (stays at import time: the tunables below are read from it)
 load_dotenv(BASE_DIR / "approach2_playwright" / ".env.approach2")
 
 OUTPUT_DIR = BASE_DIR / ".tmp" / "ai_automation_scrape"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Persistent browser profile (cookies, cache, service workers) reused across runs
+PROFILE_DIR = OUTPUT_DIR / "chrome_profile"
+
+# Browser build to run the profile with, e.g. "chrome" for installed Chrome /
+# Chrome for Testing; unset uses Playwright's bundled Chromium
+BROWSER_CHANNEL = os.getenv("BROWSER_CHANNEL") or None
+
+# Profile pages loaded at once by scrape_profiles. Concurrent scraping is
+# opt-in: the default 1 scrapes one at a time on the caller's context. This
+# is the one definition; bulk_scrape_to_sheet and linkedin_agent import it
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "1"))
+
+# Keyword searches run at once by search_many, each in its own context
+SEARCH_CONCURRENCY = int(os.getenv("SEARCH_CONCURRENCY", "3"))
+
+# SCRAPE_TIMINGS=1 prints fetch vs parse time for every profile
+SCRAPE_TIMINGS = os.getenv("SCRAPE_TIMINGS", "0") == "1"
+
+SKIP_NAMES = ["ERROR", "AUTH_REQUIRED", "CONTENT_UNAVAILABLE"]
+EXPORT_SKIP_NAMES = frozenset(SKIP_NAMES + [""])
+
+SEARCH_URL = "https://www.linkedin.com/search/results/people/"
+
+# Upper bound on scrolls per results page; scrolling stops early once
+# document.body.scrollHeight stops changing
+MAX_RESULT_SCROLLS = 6
+
+CSV_HEADERS = ["Name", "Headline", "Company", "Location", "Connections", "About", "Profile URL", "Scraped At"]
+
+# Only DOM text is read, so these are never worth downloading (JS stays on -
+# LinkedIn renders everything client-side)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Extra Chromium flags on top of the anti-detection set: no image decoding, no GPU
+LOW_BANDWIDTH_BROWSER_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+]
+
+# Every profile field in one page.evaluate() instead of ~10 locator round-trips.
+# About/experience are found with one :has() selector each rather than by
+# walking up from the #about/#experience anchors; #about is scrolled into
+# view and given a second to render, and the about text is cut to 500 code
+# points in the browser.
+PROFILE_JS = """
+async () => {
+    const text = el => ((el && el.innerText) || '').trim();
+
+    const aboutAnchor = document.getElementById('about');
+    if (aboutAnchor) {
+        aboutAnchor.scrollIntoView({block: 'center'});
+        await new Promise(resolve => setTimeout(resolve, 1000));
+    }
+
+    // Connection count lives in the top-card bullets; fall back to the head
+    // of <main> rather than rendering the whole body's text
+    const connRe = /(\\d+[\\d,]*)\\s*(?:connections?|followers?)/i;
+    const conn = text(document.querySelector('ul.pv-top-card--list-bullet')).match(connRe)
+        || text(document.querySelector('main')).slice(0, 4000).match(connRe);
+
+    return {
+        name: text(document.querySelector('h1')),
+        headline: text(document.querySelector('.text-body-medium')),
+        location: text(document.querySelector('.text-body-small.inline.t-black--light')),
+        connections: conn ? conn[0] : '',
+        about: Array.from(text(document.querySelector('section:has(#about) span[aria-hidden="true"]'))).slice(0, 500).join(''),
+        company: text(document.querySelector('section:has(#experience) span.t-14.t-normal')),
+    };
+}
+"""
+
+
+# All profile-link hrefs on a search results page (a.href is already absolute)
+PROFILE_LINKS_JS = """
+() => Array.from(document.querySelectorAll('a[href*="/in/"]'), a => a.href)
+"""
+
+
+def _add_profile_links(hrefs: list, seen: set, profile_urls: list):
+    """Append cleaned, not-yet-seen /in/ profile URLs from hrefs to profile_urls"""
+    for href in hrefs:
+        if href and '/in/' in href:
+            # Clean up URL
+            clean_url = href.split('?')[0]
+            if clean_url not in seen and clean_url.startswith('https://www.linkedin.com/in/'):
+                seen.add(clean_url)
+                profile_urls.append(clean_url)
+
+
+def _search_url(keyword: str) -> str:
+    """People-search URL for a keyword"""
+    return SEARCH_URL + "?" + urlencode({"keywords": keyword, "origin": "SWITCH_SEARCH_VERTICAL"})
+
+
+def _report_timing(profile_url: str, fetch_s: float, parse_s: float):
+    """Print the fetch/parse breakdown for one profile when SCRAPE_TIMINGS is on"""
+    if SCRAPE_TIMINGS:
+        print(f"    [timing] {profile_url.split('/in/')[-1][:30]}: fetch {fetch_s:.2f}s, parse {parse_s:.3f}s")
+
+
+def _block_heavy_resources(route):
+    """route() handler: abort images/media/fonts/CSS, let everything else through"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _block_heavy_resources_async(route):
+    """Async version of _block_heavy_resources()"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class LinkedInSearchScraper:
     """Search LinkedIn and scrape profiles"""
 
-    def __init__(self, headless: bool = False):
+    def __init__(
+        self,
+        headless: bool = False,
+        context=None,
+        anti_detection: "AntiDetection" = None,
+        rate_limiter: "RateLimiter" = None
+    ):
+        """
+        Args:
+            headless: Run browser in headless mode
+            context: Already-authenticated BrowserContext to reuse (the scraper
+                then never launches or closes a browser itself)
+            anti_detection: Shared AntiDetection instance
+            rate_limiter: Shared RateLimiter instance
+        """
+        from approach2_playwright.execution.anti_detection import AntiDetection, RateLimiter
+
         self.headless = headless
-        self.anti_detection = AntiDetection()
-        self.rate_limiter = RateLimiter(
+        self.anti_detection = anti_detection or AntiDetection()
+        self.rate_limiter = rate_limiter or RateLimiter(
             actions_per_hour=30,
             profiles_per_session=100,
         )
         self.playwright = None
         self.browser = None
-        self.context = None
+        self.context = context
+        self._owns_browser = context is None
 
     def start_browser(self):
-        """Start browser and login"""
+        """
+        Start browser and login (no-op when using a shared context).
+
+        Runs on a persistent Chrome profile (PROFILE_DIR), so cookies, the
+        HTTP cache and service workers survive between runs: a warm start
+        skips the login and serves LinkedIn's JS bundles from disk.
+        """
         from playwright.sync_api import sync_playwright
 
+        if not self._owns_browser:
+            return
+
         email = os.getenv("LINKEDIN_EMAIL")
         password = os.getenv("LINKEDIN_PASSWORD")
 
@@ -54,40 +210,27 @@ class LinkedInSearchScraper:
         self.playwright = sync_playwright().start()
 
         viewport = self.anti_detection.get_viewport_size()
-        self.browser = self.playwright.chromium.launch(
+        self.context = self.playwright.chromium.launch_persistent_context(
+            user_data_dir=str(PROFILE_DIR),
+            channel=BROWSER_CHANNEL,
             headless=self.headless,
-            args=self.anti_detection.get_browser_args()
+            args=self._browser_args(),
+            viewport={"width": viewport[0], "height": viewport[1]},
+            user_agent=self.anti_detection.user_agent
         )
+        self.context.route("**/*", _block_heavy_resources)
 
-        session_file = OUTPUT_DIR / "linkedin_session.json"
+        # Persistent contexts open with a blank tab; use it for the login check
+        page = self.context.pages[0] if self.context.pages else self.context.new_page()
 
-        # Try existing session
-        if session_file.exists():
-            try:
-                self.context = self.browser.new_context(
-                    storage_state=str(session_file),
-                    viewport={"width": viewport[0], "height": viewport[1]},
-                    user_agent=self.anti_detection.user_agent
-                )
-                page = self.context.new_page()
-                page.goto("https://www.linkedin.com/feed/", timeout=60000)
-                time.sleep(3)
-                if "/feed" in page.url:
-                    print("Reusing existing session")
-                    page.close()
-                    return
-                page.close()
-                self.context.close()
-            except:
-                pass
+        page.goto("https://www.linkedin.com/feed/", timeout=60000)
+        time.sleep(3)
+        if "/feed" in page.url:
+            print("Reusing existing session")
+            page.close()
+            return
 
         # Fresh login
-        self.context = self.browser.new_context(
-            viewport={"width": viewport[0], "height": viewport[1]},
-            user_agent=self.anti_detection.user_agent
-        )
-
-        page = self.context.new_page()
         print("Logging in to LinkedIn...")
         page.goto("https://www.linkedin.com/login", timeout=60000)
         time.sleep(2)
@@ -102,19 +245,22 @@ class LinkedInSearchScraper:
                 break
             time.sleep(1)
 
-        self.context.storage_state(path=str(session_file))
         print("Login successful!")
         page.close()
 
+    def _browser_args(self) -> list:
+        """Anti-detection launch args plus the low-bandwidth flags (deduped)"""
+        return list(dict.fromkeys(self.anti_detection.get_browser_args() + LOW_BANDWIDTH_BROWSER_ARGS))
+
     def search_profiles(self, keyword: str, max_results: int = 100) -> list:
         """Search for profiles by keyword"""
         print(f"\nSearching for: {keyword}")
 
-        from urllib.parse import quote
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={quote(keyword)}&origin=SWITCH_SEARCH_VERTICAL"
+        search_url = _search_url(keyword)
 
         page = self.context.new_page()
         profile_urls = []
+        seen = set()
 
         try:
             page.goto(search_url, timeout=60000)
@@ -126,24 +272,23 @@ class LinkedInSearchScraper:
             while len(profile_urls) < max_results and pages_scraped < max_pages:
                 print(f"  Page {pages_scraped + 1}: Found {len(profile_urls)} profiles so far...")
 
-                # Scroll to load all results on page
-                for _ in range(3):
-                    page.mouse.wheel(0, 500)
-                    time.sleep(1)
+                # Scroll until the page stops growing (results all loaded)
+                prev_height = -1
+                for _ in range(MAX_RESULT_SCROLLS):
+                    height = page.evaluate("document.body.scrollHeight")
+                    if height == prev_height:
+                        break
+                    prev_height = height
+                    page.mouse.wheel(0, height)
+                    page.wait_for_timeout(400)
 
-                # Find profile links
-                links = page.locator('a[href*="/in/"]')
+                # Find profile links - every href in one round-trip
+                try:
+                    hrefs = page.evaluate(PROFILE_LINKS_JS)
+                except:
+                    hrefs = []
 
-                for i in range(links.count()):
-                    try:
-                        href = links.nth(i).get_attribute('href')
-                        if href and '/in/' in href and href not in profile_urls:
-                            # Clean up URL
-                            clean_url = href.split('?')[0]
-                            if clean_url.startswith('https://www.linkedin.com/in/'):
-                                profile_urls.append(clean_url)
-                    except:
-                        pass
+                _add_profile_links(hrefs, seen, profile_urls)
 
                 # Try to go to next page
                 pages_scraped += 1
@@ -167,98 +312,52 @@ class LinkedInSearchScraper:
         finally:
             page.close()
 
-        # Remove duplicates
-        profile_urls = list(dict.fromkeys(profile_urls))[:max_results]
+        profile_urls = profile_urls[:max_results]
         print(f"  Found {len(profile_urls)} unique profiles")
 
         return profile_urls
 
-    def scrape_profile(self, profile_url: str) -> dict:
-        """Scrape a single profile"""
-        page = self.context.new_page()
+    def scrape_profile(self, profile_url: str, page=None) -> dict:
+        """
+        Scrape a single profile.
+
+        Args:
+            profile_url: Profile to scrape
+            page: Page to reuse (left open); a temporary page is used if None
+        """
+        own_page = page is None
+        if own_page:
+            page = self.context.new_page()
         profile_data = {}
 
         try:
+            started = time.perf_counter()
             page.goto(profile_url, timeout=30000)
             time.sleep(4)
+            fetched = time.perf_counter()
 
             # Check for blocks
             if "authwall" in page.url or "login" in page.url:
+                self.rate_limiter.record_outcome(False)
                 return {"name": "AUTH_REQUIRED", "profile_url": profile_url, "scraped_at": datetime.now().isoformat()}
 
             page_title = page.title()
             if "Content Unavailable" in page_title:
+                self.rate_limiter.record_outcome(False)
                 return {"name": "CONTENT_UNAVAILABLE", "profile_url": profile_url, "scraped_at": datetime.now().isoformat()}
 
-            # Name
-            name = ""
-            try:
-                h1 = page.locator('h1').first
-                if h1.count() > 0:
-                    name = h1.inner_text().strip()
-            except:
-                pass
-
-            # Headline
-            headline = ""
-            try:
-                hl = page.locator('.text-body-medium').first
-                if hl.count() > 0:
-                    headline = hl.inner_text().strip()
-            except:
-                pass
-
-            # Location
-            location = ""
-            try:
-                loc = page.locator('.text-body-small.inline.t-black--light').first
-                if loc.count() > 0:
-                    location = loc.inner_text().strip()
-            except:
-                pass
-
-            # Connections/Followers
-            connections = ""
-            try:
-                page_text = page.inner_text('body')
-                conn_match = re.search(r'(\d+[\d,]*)\s*(?:connections?|followers?)', page_text, re.IGNORECASE)
-                if conn_match:
-                    connections = conn_match.group(0)
-            except:
-                pass
-
-            # About
-            about = ""
-            try:
-                about_section = page.locator('#about')
-                if about_section.count() > 0:
-                    about_section.scroll_into_view_if_needed()
-                    time.sleep(1)
-                    # Try to get about text
-                    about_text = page.locator('#about').locator('..').locator('..').locator('span[aria-hidden="true"]')
-                    if about_text.count() > 0:
-                        about = about_text.first.inner_text().strip()[:500]
-            except:
-                pass
-
-            # Company
-            company = ""
-            try:
-                exp_section = page.locator('#experience')
-                if exp_section.count() > 0:
-                    company_el = page.locator('#experience').locator('..').locator('..').locator('span.t-14.t-normal')
-                    if company_el.count() > 0:
-                        company = company_el.first.inner_text().strip()
-            except:
-                pass
+            # All fields in one round-trip
+            data = page.evaluate(PROFILE_JS)
+            self.rate_limiter.record_outcome(True)
+            _report_timing(profile_url, fetched - started, time.perf_counter() - fetched)
 
             profile_data = {
-                "name": name,
-                "headline": headline,
-                "location": location,
-                "company": company,
-                "connections": connections,
-                "about": about,
+                "name": data["name"],
+                "headline": data["headline"],
+                "location": data["location"],
+                "company": data["company"],
+                "connections": data["connections"],
+                "about": data["about"],
                 "profile_url": profile_url,
                 "scraped_at": datetime.now().isoformat()
             }
@@ -266,6 +365,7 @@ class LinkedInSearchScraper:
             self.rate_limiter.record_profile_scrape()
 
         except Exception as e:
+            self.rate_limiter.record_outcome(False)
             profile_data = {
                 "name": "ERROR",
                 "headline": str(e)[:100],
@@ -273,44 +373,367 @@ class LinkedInSearchScraper:
                 "scraped_at": datetime.now().isoformat()
             }
         finally:
-            page.close()
+            if own_page:
+                page.close()
 
         return profile_data
 
-    def scrape_profiles(self, profile_urls: list) -> list:
-        """Scrape multiple profiles"""
+    async def _search_profiles_async(self, context, keyword: str, max_results: int = 100) -> list:
+        """Async mirror of search_profiles() on a caller-provided context"""
+        print(f"\nSearching for: {keyword}")
+
+        search_url = _search_url(keyword)
+
+        page = await context.new_page()
+        profile_urls = []
+        seen = set()
+
+        try:
+            await page.goto(search_url, timeout=60000)
+            await asyncio.sleep(5)
+
+            pages_scraped = 0
+            max_pages = (max_results // 10) + 1
+
+            while len(profile_urls) < max_results and pages_scraped < max_pages:
+                # Scroll until the page stops growing (results all loaded)
+                prev_height = -1
+                for _ in range(MAX_RESULT_SCROLLS):
+                    height = await page.evaluate("document.body.scrollHeight")
+                    if height == prev_height:
+                        break
+                    prev_height = height
+                    await page.mouse.wheel(0, height)
+                    await page.wait_for_timeout(400)
+
+                try:
+                    hrefs = await page.evaluate(PROFILE_LINKS_JS)
+                except:
+                    hrefs = []
+
+                _add_profile_links(hrefs, seen, profile_urls)
+
+                pages_scraped += 1
+
+                if len(profile_urls) >= max_results:
+                    break
+
+                # Click next button
+                try:
+                    next_btn = page.locator('button[aria-label="Next"]')
+                    if await next_btn.count() > 0 and await next_btn.first.is_enabled():
+                        await next_btn.first.click()
+                        await asyncio.sleep(4)
+                    else:
+                        break
+                except:
+                    break
+
+        except Exception as e:
+            print(f"Search error ({keyword}): {e}")
+        finally:
+            await page.close()
+
+        profile_urls = profile_urls[:max_results]
+        print(f"  {keyword}: found {len(profile_urls)} unique profiles")
+
+        return profile_urls
+
+    async def search_many_async(
+        self,
+        keywords: list,
+        max_results: int = 100,
+        concurrency: int = SEARCH_CONCURRENCY,
+        storage_state=None
+    ) -> list:
+        """
+        Run several keyword searches at once.
+
+        A small pool of contexts (one per concurrent search) is created on a
+        single async browser from the same saved session; each search checks
+        one out, so at most `concurrency` search pages are in flight.
+
+        Returns:
+            One list of profile URLs per keyword, in keyword order
+        """
+        from playwright.async_api import async_playwright
+
+        viewport = self.anti_detection.get_viewport_size()
+
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=self.headless,
+                args=self._browser_args()
+            )
+            contexts = asyncio.Queue()
+            try:
+                for _ in range(max(1, min(concurrency, len(keywords)))):
+                    context = await browser.new_context(
+                        storage_state=storage_state,
+                        viewport={"width": viewport[0], "height": viewport[1]},
+                        user_agent=self.anti_detection.user_agent
+                    )
+                    await context.route("**/*", _block_heavy_resources_async)
+                    contexts.put_nowait(context)
+
+                async def search(keyword: str) -> list:
+                    context = await contexts.get()
+                    try:
+                        urls = await self._search_profiles_async(context, keyword, max_results)
+                        # Pause before this context's next search
+                        await asyncio.sleep(self.rate_limiter.adaptive_delay(5))
+                        return urls
+                    finally:
+                        contexts.put_nowait(context)
+
+                return await asyncio.gather(*(search(k) for k in keywords))
+            finally:
+                await browser.close()
+
+    def search_many(self, keywords: list, max_results: int = 100, concurrency: int = SEARCH_CONCURRENCY) -> list:
+        """
+        Search several keywords, concurrently when concurrency > 1.
+
+        Returns:
+            One list of profile URLs per keyword, in keyword order
+        """
+        if concurrency > 1 and len(keywords) > 1:
+            storage_state = self.context.storage_state()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(
+                    asyncio.run,
+                    self.search_many_async(keywords, max_results, concurrency, storage_state)
+                ).result()
+
+        results = []
+        for keyword in keywords:
+            results.append(self.search_profiles(keyword, max_results=max_results))
+            time.sleep(self.rate_limiter.adaptive_delay(5))  # Pause between searches
+        return results
+
+    async def _scrape_profile_async(self, page, profile_url: str) -> dict:
+        """Async mirror of scrape_profile() on a caller-provided page"""
+        try:
+            started = time.perf_counter()
+            await page.goto(profile_url, timeout=30000)
+            await asyncio.sleep(4)
+            fetched = time.perf_counter()
+
+            # Check for blocks
+            if "authwall" in page.url or "login" in page.url:
+                self.rate_limiter.record_outcome(False)
+                return {"name": "AUTH_REQUIRED", "profile_url": profile_url, "scraped_at": datetime.now().isoformat()}
+
+            page_title = await page.title()
+            if "Content Unavailable" in page_title:
+                self.rate_limiter.record_outcome(False)
+                return {"name": "CONTENT_UNAVAILABLE", "profile_url": profile_url, "scraped_at": datetime.now().isoformat()}
+
+            # All fields in one round-trip
+            data = await page.evaluate(PROFILE_JS)
+            self.rate_limiter.record_outcome(True)
+            _report_timing(profile_url, fetched - started, time.perf_counter() - fetched)
+
+            return {
+                "name": data["name"],
+                "headline": data["headline"],
+                "location": data["location"],
+                "company": data["company"],
+                "connections": data["connections"],
+                "about": data["about"],
+                "profile_url": profile_url,
+                "scraped_at": datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            self.rate_limiter.record_outcome(False)
+            return {
+                "name": "ERROR",
+                "headline": str(e)[:100],
+                "profile_url": profile_url,
+                "scraped_at": datetime.now().isoformat()
+            }
+
+    async def scrape_profiles_async(
+        self,
+        profile_urls: list,
+        concurrency: int = SCRAPE_CONCURRENCY,
+        storage_state=None,
+        on_profile=None,
+        context=None
+    ) -> list:
+        """
+        Scrape profiles with up to `concurrency` pages loading at once.
+
+        One async browser + context is shared by all tasks, which check out
+        one of `concurrency` long-lived pages for each profile. Rate-limit budget is reserved under a lock before a
+        page is opened, so concurrent tasks never overshoot it.
+
+        Args:
+            profile_urls: Profile URLs to scrape
+            concurrency: Maximum pages in flight
+            storage_state: Logged-in session (path or dict from
+                BrowserContext.storage_state())
+            on_profile: Called with each profile dict as soon as it is scraped
+            context: Logged-in async BrowserContext to scrape on instead of
+                launching a browser (its pages are closed, it is left open)
+
+        Returns:
+            Profiles in input order (profiles skipped by the rate limit omitted)
+        """
+        total = len(profile_urls)
+        print(f"\nScraping {total} profiles ({concurrency} at a time)...")
+
+        if context is not None:
+            return await self._scrape_on_context(context, profile_urls, concurrency, on_profile)
+
+        from playwright.async_api import async_playwright
+
+        viewport = self.anti_detection.get_viewport_size()
+
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=self.headless,
+                args=self._browser_args()
+            )
+            try:
+                context = await browser.new_context(
+                    storage_state=storage_state,
+                    viewport={"width": viewport[0], "height": viewport[1]},
+                    user_agent=self.anti_detection.user_agent
+                )
+                await context.route("**/*", _block_heavy_resources_async)
+                return await self._scrape_on_context(context, profile_urls, concurrency, on_profile)
+            finally:
+                await browser.close()
+
+    async def _scrape_on_context(self, context, profile_urls: list, concurrency: int, on_profile=None) -> list:
+        """scrape_profiles_async's worker pool on a given context"""
+        total = len(profile_urls)
+        lock = asyncio.Lock()
+        done = 0
+
+        # One page per worker, reused via goto() for every profile it
+        # handles; the queue doubles as the concurrency bound
+        pages = asyncio.Queue()
+        for _ in range(min(concurrency, total)):
+            pages.put_nowait(await context.new_page())
+
+        async def scrape(url: str):
+            nonlocal done
+            page = await pages.get()
+            try:
+                async with lock:
+                    if not self.rate_limiter.can_scrape_profile():
+                        return None
+                    self.rate_limiter.record_profile_scrape()
+
+                profile = await self._scrape_profile_async(page, url)
+                if on_profile:
+                    on_profile(profile)
+
+                done += 1
+                name = profile.get("name", "")
+                status = f"OK - {name[:30]}" if name and name not in SKIP_NAMES else f"SKIP - {name}"
+                print(f"[{done}/{total}] {url.split('/in/')[-1][:30]}... {status}")
+
+                await asyncio.sleep(self.rate_limiter.adaptive_delay(self.anti_detection.human_delay(2.5)))
+                return profile
+            finally:
+                # A crashed/closed page is swapped for a fresh one
+                if page.is_closed():
+                    page = await context.new_page()
+                pages.put_nowait(page)
+
+        try:
+            results = await asyncio.gather(*(scrape(url) for url in profile_urls))
+        finally:
+            while not pages.empty():
+                page = pages.get_nowait()
+                if not page.is_closed():
+                    await page.close()
+
+        results = [r for r in results if r is not None]
+        if len(results) < total:
+            print(f"\nRate limit reached after {len(results)} profiles.")
+        return results
+
+    def scrape_profiles(
+        self,
+        profile_urls: list,
+        concurrency: int = SCRAPE_CONCURRENCY,
+        on_profile=None
+    ) -> list:
+        """
+        Scrape multiple profiles.
+
+        With concurrency > 1 the work runs on the async API (see
+        scrape_profiles_async), logged in with this scraper's session. The
+        sync API may already own this thread, so the event loop gets its own.
+
+        Args:
+            profile_urls: Profile URLs to scrape
+            concurrency: Maximum pages in flight
+            on_profile: Called with each profile dict as soon as it is scraped
+                (e.g. ProfileWriter.write), so results survive a crash
+        """
+        if concurrency > 1 and len(profile_urls) > 1:
+            storage_state = self.context.storage_state()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(
+                    asyncio.run,
+                    self.scrape_profiles_async(profile_urls, concurrency, storage_state, on_profile)
+                ).result()
+
+        return self._scrape_profiles_sequential(profile_urls, on_profile)
+
+    def _scrape_profiles_sequential(self, profile_urls: list, on_profile=None) -> list:
+        """Scrape profiles one at a time on the sync context"""
         results = []
         total = len(profile_urls)
 
         print(f"\nScraping {total} profiles...")
 
-        for i, url in enumerate(profile_urls):
-            if not self.rate_limiter.can_scrape_profile():
-                print(f"\nRate limit reached after {i} profiles.")
-                break
+        # One page for the whole run; each profile is just a goto()
+        page = self.context.new_page()
 
-            print(f"[{i+1}/{total}] {url.split('/in/')[-1][:30]}...", end=" ")
+        try:
+            for i, url in enumerate(profile_urls):
+                if not self.rate_limiter.can_scrape_profile():
+                    print(f"\nRate limit reached after {i} profiles.")
+                    break
+
+                print(f"[{i+1}/{total}] {url.split('/in/')[-1][:30]}...", end=" ")
 
-            profile = self.scrape_profile(url)
-            results.append(profile)
+                if page.is_closed():
+                    page = self.context.new_page()
+                profile = self.scrape_profile(url, page=page)
+                results.append(profile)
+                if on_profile:
+                    on_profile(profile)
 
-            name = profile.get("name", "")
-            if name and name not in ["ERROR", "AUTH_REQUIRED", "CONTENT_UNAVAILABLE"]:
-                print(f"OK - {name[:30]}")
-            else:
-                print(f"SKIP - {name}")
+                name = profile.get("name", "")
+                if name and name not in SKIP_NAMES:
+                    print(f"OK - {name[:30]}")
+                else:
+                    print(f"SKIP - {name}")
 
-            # Delay
-            time.sleep(self.anti_detection.human_delay(2.5))
+                # Delay
+                time.sleep(self.rate_limiter.adaptive_delay(self.anti_detection.human_delay(2.5)))
 
-            # Break every 15 profiles
-            if i > 0 and i % 15 == 0:
-                print("  Taking a short break...")
-                time.sleep(10)
+                # Break every 15 profiles
+                if i > 0 and i % 15 == 0:
+                    print("  Taking a short break...")
+                    time.sleep(self.rate_limiter.adaptive_delay(10))
+        finally:
+            if not page.is_closed():
+                page.close()
 
         return results
 
     def close(self):
+        if not self._owns_browser:
+            return
         if self.context:
             self.context.close()
         if self.browser:
@@ -319,33 +742,96 @@ class LinkedInSearchScraper:
             self.playwright.stop()
 
 
-def export_to_csv(profiles: list, filename: str = "ai_automation_profiles.csv"):
-    """Export profiles to CSV"""
+def _csv_row(p: dict) -> tuple:
+    """One CSV_HEADERS row for a profile dict"""
+    return (
+        p.get("name", ""),
+        p.get("headline", ""),
+        p.get("company", ""),
+        p.get("location", ""),
+        p.get("connections", ""),
+        (p.get("about", "") or "")[:300],
+        p.get("profile_url", ""),
+        p.get("scraped_at", "")
+    )
+
+
+class ProfileWriter:
+    """
+    Appends each profile to a JSONL file and a CSV file the moment it is
+    scraped, so a crash mid-run keeps everything collected so far.
+
+    Usage:
+        with ProfileWriter("ai_automation_profiles") as writer:
+            scraper.scrape_profiles(urls, on_profile=writer.write)
+    """
+
+    def __init__(self, basename: str):
+        self.jsonl_file = OUTPUT_DIR / f"{basename}.jsonl"
+        self.csv_file = OUTPUT_DIR / f"{basename}.csv"
+        self.count = 0
+        self._jsonl = None
+        self._csv = None
+        self._writer = None
+
+    def __enter__(self):
+        self._jsonl = open(self.jsonl_file, "w", encoding="utf-8")
+        self._csv = open(self.csv_file, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._csv)
+        self._writer.writerow(CSV_HEADERS)
+        return self
+
+    def write(self, profile: dict):
+        """Record one profile (errors go to the JSONL only, as with export_to_csv)"""
+        self._jsonl.write(json.dumps(profile, ensure_ascii=False) + "\n")
+        self._jsonl.flush()
+        if profile.get("name") not in EXPORT_SKIP_NAMES:
+            self._writer.writerow(_csv_row(profile))
+            self._csv.flush()
+            self.count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        self._jsonl.close()
+        self._csv.close()
+
+    def iter_profiles(self):
+        """Read the written profiles back from the JSONL file"""
+        with open(self.jsonl_file, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def _dump_json(path: Path, data):
+    """Write data as indented UTF-8 JSON (orjson when installed)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def export_to_csv(profiles, filename: str = "ai_automation_profiles.csv"):
+    """Export profiles (any iterable of dicts) to CSV, streaming rows via writerows"""
     csv_file = OUTPUT_DIR / filename
-
-    headers = ["Name", "Headline", "Company", "Location", "Connections", "About", "Profile URL", "Scraped At"]
-
-    # Filter out errors
-    valid_profiles = [p for p in profiles if p.get("name") not in ["ERROR", "AUTH_REQUIRED", "CONTENT_UNAVAILABLE", ""]]
-
-    with open(csv_file, "w", newline="", encoding="utf-8") as f:
+    count = 0
+
+    def rows():
+        nonlocal count
+        for p in profiles:
+            # Filter out errors
+            if p.get("name") in EXPORT_SKIP_NAMES:
+                continue
+            count += 1
+            yield _csv_row(p)
+
+    with open(csv_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
-        writer.writerow(headers)
-
-        for p in valid_profiles:
-            writer.writerow([
-                p.get("name", ""),
-                p.get("headline", ""),
-                p.get("company", ""),
-                p.get("location", ""),
-                p.get("connections", ""),
-                (p.get("about", "") or "")[:300],
-                p.get("profile_url", ""),
-                p.get("scraped_at", "")
-            ])
+        writer.writerow(CSV_HEADERS)
+        writer.writerows(rows())
 
     print(f"\n{'='*60}")
-    print(f"EXPORTED {len(valid_profiles)} profiles to:")
+    print(f"EXPORTED {count} profiles to:")
     print(f"  {csv_file}")
     print(f"{'='*60}")
 
@@ -371,35 +857,35 @@ def main():
     try:
         scraper.start_browser()
 
+        # Search all terms (a few at a time); the seen set drops URLs that
+        # several keywords turn up while the list keeps search-result order
         all_profile_urls = []
+        seen = set()
+        for urls in scraper.search_many(search_terms, max_results=25):
+            for url in urls:
+                if url not in seen:
+                    seen.add(url)
+                    all_profile_urls.append(url)
 
-        # Search for each term
-        for term in search_terms:
-            urls = scraper.search_profiles(term, max_results=25)
-            all_profile_urls.extend(urls)
-            time.sleep(5)  # Pause between searches
-
-        # Remove duplicates
-        all_profile_urls = list(dict.fromkeys(all_profile_urls))
         print(f"\nTotal unique profiles found: {len(all_profile_urls)}")
 
         # Save URLs to file
         urls_file = OUTPUT_DIR / "found_profile_urls.txt"
-        with open(urls_file, "w") as f:
-            f.write("\n".join(all_profile_urls))
+        urls_file.write_text("\n".join(all_profile_urls))
         print(f"Saved URLs to: {urls_file}")
 
-        # Scrape all profiles
+        # Scrape all profiles, writing JSONL + CSV rows as each one lands
         if all_profile_urls:
-            profiles = scraper.scrape_profiles(all_profile_urls[:100])  # Max 100
+            with ProfileWriter("ai_automation_profiles") as writer:
+                scraper.scrape_profiles(all_profile_urls[:100], on_profile=writer.write)  # Max 100
 
-            # Save JSON
-            json_file = OUTPUT_DIR / "ai_automation_profiles.json"
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(profiles, f, indent=2, ensure_ascii=False)
+            print(f"\n{'='*60}")
+            print(f"EXPORTED {writer.count} profiles to:")
+            print(f"  {writer.csv_file}")
+            print(f"{'='*60}")
 
-            # Export to CSV
-            export_to_csv(profiles)
+            # Pretty JSON copy, only once the run has finished
+            _dump_json(OUTPUT_DIR / "ai_automation_profiles.json", list(writer.iter_profiles()))
 
     finally:
         scraper.close()
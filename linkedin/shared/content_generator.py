@@ -6,9 +6,116 @@ NOTE: This is a stub implementation. LLM integration will be added later.
 Currently returns template-based content for testing.
 """
 
+import re
+from collections import Counter
+from itertools import chain
 from typing import List, Optional
 from .types import LinkedInProfile, LinkedInPost, ContentDraft
 
+_HASHTAG_RE = re.compile(r'#(\w+)')
+
+# Templates are str.format() strings, built once at import instead of as
+# f-strings on every call
+
+_POST_TEMPLATES = {
+    "thought_leadership": """I've been thinking a lot about {topic} lately.
+
+Here's what I've learned:
+
+1. [Key insight about {topic}]
+2. [Second insight]
+3. [Third insight]
+
+What's your take on this?
+
+#LinkedIn #ThoughtLeadership""",
+
+    "tip": """Quick tip on {topic}:
+
+[Your actionable advice here]
+
+Save this for later.
+
+#Tips #{topic_tag}""",
+
+    "question": """Question for my network:
+
+What's your biggest challenge with {topic}?
+
+I'm curious to hear different perspectives.
+
+#Discussion #OpenQuestion""",
+
+    "story": """Story time about {topic}...
+
+[Beginning of story]
+
+[Middle - the challenge]
+
+[End - the lesson learned]
+
+Has anyone else experienced something similar?
+
+#Storytelling #Lessons"""
+}
+
+_COMMENT_TEMPLATES = {
+    "value_add": [
+        "Great point, {author}! I'd add that [related insight]. This is especially relevant when [context].",
+        "This resonates. In my experience, [related experience that adds value].",
+        "Valuable perspective. One thing I've found helpful with this is [tip]."
+    ],
+    "question": [
+        "Interesting take, {author}! How do you handle [related challenge]?",
+        "Love this. What's been your biggest learning when implementing this?",
+        "Great share! Curious - have you found [specific approach] to work well?"
+    ],
+    "experience": [
+        "This hits home. When I [similar situation], I learned [lesson].",
+        "Totally agree from experience. We faced this exact challenge and found that [solution].",
+        "Can relate! [Brief personal story that's relevant]."
+    ],
+    "agreement": [
+        "Spot on, {author}! This is exactly what [industry/field] needs to hear.",
+        "100% this. More people need to understand [key point from post].",
+        "Couldn't agree more. The part about [specific mention] really stood out."
+    ]
+}
+
+_MESSAGE_TEMPLATES = {
+    "connection": """Hi {first_name},
+
+I came across your profile and was impressed by your work in {headline}.
+
+I'd love to connect and learn more about [specific interest].
+
+Looking forward to connecting!""",
+
+    "follow_up": """Hi {first_name},
+
+Thanks for connecting! I noticed you're working on [topic].
+
+I'd love to hear more about [specific question].
+
+Would you be open to a quick chat?""",
+
+    "pitch": """Hi {first_name},
+
+I noticed [personalization point] and thought you might be interested in [value proposition].
+
+We've helped [similar companies/people] achieve [result].
+
+Would you be open to a brief conversation?""",
+
+    "thank_you": """Hi {first_name},
+
+Just wanted to reach out and say thank you for [reason].
+
+Your insights on [topic] have been really valuable.
+
+Looking forward to staying connected!"""
+}
+
 
 class ContentGenerator:
     """
@@ -30,6 +137,13 @@ class ContentGenerator:
         self.api_key = api_key
         self._llm_enabled = llm_provider is not None and api_key is not None
 
+        # Hashtags of each post template that doesn't derive one from the topic
+        self._post_hashtags = {
+            style: _HASHTAG_RE.findall(template)
+            for style, template in _POST_TEMPLATES.items()
+            if "{topic_tag}" not in template
+        }
+
     def generate_post(
         self,
         topic: str,
@@ -111,13 +225,7 @@ class ContentGenerator:
             List of trending topics with scores
         """
         # Simple keyword extraction (will be LLM-enhanced later)
-        from collections import Counter
-
-        all_hashtags = []
-        for post in posts:
-            all_hashtags.extend(post.hashtags)
-
-        hashtag_counts = Counter(all_hashtags)
+        hashtag_counts = Counter(chain.from_iterable(post.hashtags for post in posts))
 
         trending = [
             {"topic": tag, "count": count, "score": min(1.0, count / 10)}
@@ -132,50 +240,13 @@ class ContentGenerator:
         self, topic: str, style: str, tone: str, context: Optional[dict]
     ) -> ContentDraft:
         """Generate post using templates"""
-        templates = {
-            "thought_leadership": f"""I've been thinking a lot about {topic} lately.
+        if style not in _POST_TEMPLATES:
+            style = "thought_leadership"
+        body = _POST_TEMPLATES[style].format(topic=topic, topic_tag=topic.replace(' ', ''))
 
-Here's what I've learned:
-
-1. [Key insight about {topic}]
-2. [Second insight]
-3. [Third insight]
-
-What's your take on this?
-
-#LinkedIn #ThoughtLeadership""",
-
-            "tip": f"""Quick tip on {topic}:
-
-[Your actionable advice here]
-
-Save this for later.
-
-#Tips #{topic.replace(' ', '')}""",
-
-            "question": f"""Question for my network:
-
-What's your biggest challenge with {topic}?
-
-I'm curious to hear different perspectives.
-
-#Discussion #OpenQuestion""",
-
-            "story": f"""Story time about {topic}...
-
-[Beginning of story]
-
-[Middle - the challenge]
-
-[End - the lesson learned]
-
-Has anyone else experienced something similar?
-
-#Storytelling #Lessons"""
-        }
-
-        body = templates.get(style, templates["thought_leadership"])
-        hashtags = self._extract_hashtags(body)
+        # Cached unless the topic itself feeds a hashtag
+        hashtags = self._post_hashtags.get(style) if "#" not in topic else None
+        hashtags = list(hashtags) if hashtags is not None else self._extract_hashtags(body)
 
         return ContentDraft(
             body=body,
@@ -189,34 +260,11 @@ Has anyone else experienced something similar?
         """Generate comment options using templates"""
         author = post.author_name.split()[0]  # First name
 
-        templates = {
-            "value_add": [
-                f"Great point, {author}! I'd add that [related insight]. This is especially relevant when [context].",
-                f"This resonates. In my experience, [related experience that adds value].",
-                f"Valuable perspective. One thing I've found helpful with this is [tip]."
-            ],
-            "question": [
-                f"Interesting take, {author}! How do you handle [related challenge]?",
-                f"Love this. What's been your biggest learning when implementing this?",
-                f"Great share! Curious - have you found [specific approach] to work well?"
-            ],
-            "experience": [
-                f"This hits home. When I [similar situation], I learned [lesson].",
-                f"Totally agree from experience. We faced this exact challenge and found that [solution].",
-                f"Can relate! [Brief personal story that's relevant]."
-            ],
-            "agreement": [
-                f"Spot on, {author}! This is exactly what [industry/field] needs to hear.",
-                f"100% this. More people need to understand [key point from post].",
-                f"Couldn't agree more. The part about [specific mention] really stood out."
-            ]
-        }
-
-        comment_templates = templates.get(comment_style, templates["value_add"])
+        comment_templates = _COMMENT_TEMPLATES.get(comment_style, _COMMENT_TEMPLATES["value_add"])
 
         return [
             ContentDraft(
-                body=template,
+                body=template.format(author=author),
                 content_type="comment",
                 target_post=post
             )
@@ -229,41 +277,8 @@ Has anyone else experienced something similar?
         """Generate message using templates"""
         first_name = profile.name.split()[0]
 
-        templates = {
-            "connection": f"""Hi {first_name},
-
-I came across your profile and was impressed by your work in {profile.headline or 'your field'}.
-
-I'd love to connect and learn more about [specific interest].
-
-Looking forward to connecting!""",
-
-            "follow_up": f"""Hi {first_name},
-
-Thanks for connecting! I noticed you're working on [topic].
-
-I'd love to hear more about [specific question].
-
-Would you be open to a quick chat?""",
-
-            "pitch": f"""Hi {first_name},
-
-I noticed [personalization point] and thought you might be interested in [value proposition].
-
-We've helped [similar companies/people] achieve [result].
-
-Would you be open to a brief conversation?""",
-
-            "thank_you": f"""Hi {first_name},
-
-Just wanted to reach out and say thank you for [reason].
-
-Your insights on [topic] have been really valuable.
-
-Looking forward to staying connected!"""
-        }
-
-        body = templates.get(purpose, templates["connection"])
+        template = _MESSAGE_TEMPLATES.get(purpose, _MESSAGE_TEMPLATES["connection"])
+        body = template.format(first_name=first_name, headline=profile.headline or 'your field')
 
         personalization = points or []
         if profile.company:
@@ -280,8 +295,7 @@ Looking forward to staying connected!"""
 
     def _extract_hashtags(self, text: str) -> List[str]:
         """Extract hashtags from text"""
-        import re
-        return re.findall(r'#(\w+)', text)
+        return _HASHTAG_RE.findall(text)
 
     # LLM-based implementations (to be implemented later)
 
@@ -3,12 +3,211 @@ Profile Analyzer for LinkedIn Automation
 Scores and categorizes profiles for targeting
 """
 
+import functools
+import math
+import re
+from collections import OrderedDict
 from typing import List, Optional, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 from .types import LinkedInProfile, LinkedInPost, CommentOpportunity
 
+# Optional: pyahocorasick finds every title/keyword in one pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Batches at least this big use the numba kernel (smaller ones aren't worth
+# the dispatch / first-call compile)
+NUMBA_MIN_BATCH = 5000
+
+# Each matched title keyword adds this to the title score (capped at 1.0),
+# so KEYWORD_HITS_FOR_MAX matches already score the maximum
+TITLE_KEYWORD_SCORE = 0.3
+KEYWORD_HITS_FOR_MAX = math.ceil(1.0 / TITLE_KEYWORD_SCORE)
+
+# Profile scores remembered per analyzer (least recently used dropped first)
+SCORE_CACHE_SIZE = 4096
+
+# Headline/title keywords that mark a profile as a possible influencer,
+# competitor or partner (see categorize_profile)
+CATEGORY_KEYWORDS = {
+    "influencer": ["speaker", "author", "thought leader", "influencer", "creator"],
+    "competitor": ["founder", "ceo", "co-founder"],
+    "partner": ["partner", "agency", "consultant", "advisor"],
+}
 
-@dataclass
+
+def _build_title_automaton(titles, keywords):
+    """
+    Aho-Corasick automaton over case-folded titles and title keywords.
+
+    Payloads are (word, is_title, keyword_count): a word listed as a title
+    scores 1.0 outright, keyword_count is how often it appears in keywords.
+
+    Returns:
+        The automaton, or None if pyahocorasick isn't installed or there is
+        nothing to match
+    """
+    if ahocorasick is None:
+        return None
+
+    payloads = {}
+    for word in titles:
+        if word:
+            payloads[word] = (word, True, 0)
+    for word in keywords:
+        if word:
+            _, is_title, count = payloads.get(word, (word, False, 0))
+            payloads[word] = (word, is_title, count + 1)
+    if not payloads:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for word, payload in payloads.items():
+        automaton.add_word(word, payload)
+    automaton.make_automaton()
+    return automaton
+
+
+# Criterion slots: index into FEATURE_WEIGHTS and the score_profiles_batch columns
+SLOT_INDUSTRY = 0
+SLOT_TITLE = 1
+SLOT_COMPANY = 2
+SLOT_LOCATION = 3
+SLOT_DEGREE = 4
+SLOT_FOLLOWERS = 5
+
+FEATURE_WEIGHTS = np.array([0.25, 0.30, 0.15, 0.10, 0.10, 0.10])
+
+# Plain-float copy for score_profile (NumPy scalars are slower one at a time)
+_WEIGHTS = tuple(FEATURE_WEIGHTS.tolist())
+
+
+def _weighted_reduce_numpy(values: np.ndarray, active: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Per-row weighted average of values over active columns (0.5 if none)"""
+    w = active * weights
+    total_weight = w.sum(axis=1)
+    weighted_sum = (values * w).sum(axis=1)
+    return np.divide(weighted_sum, total_weight, out=np.full(len(values), 0.5), where=total_weight > 0)
+
+
+@functools.cache
+def _weighted_reduce_numba():
+    """
+    Optional: numba JIT-compiles the weighted reduction for large batches.
+
+    numba is imported and the kernel defined on the first batch that needs
+    it, so importers that never score NUMBA_MIN_BATCH profiles don't pay for
+    either.
+
+    Returns:
+        The compiled kernel, or None if numba isn't installed
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def kernel(values, active, weights):
+        """Same as _weighted_reduce_numpy, one profile per prange iteration"""
+        n, f = values.shape
+        out = np.empty(n)
+        for i in prange(n):
+            weighted_sum = 0.0
+            total_weight = 0.0
+            for j in range(f):
+                if active[i, j]:
+                    weighted_sum += values[i, j] * weights[j]
+                    total_weight += weights[j]
+            out[i] = weighted_sum / total_weight if total_weight > 0 else 0.5
+        return out
+
+    return kernel
+
+
+def _weighted_reduce(values: np.ndarray, active: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted average per row, on numba for large batches when available"""
+    if len(values) >= NUMBA_MIN_BATCH:
+        kernel = _weighted_reduce_numba()
+        if kernel is not None:
+            return kernel(values, active, weights)
+    return _weighted_reduce_numpy(values, active, weights)
+
+
+def _substring_match(texts: np.ndarray, needles) -> np.ndarray:
+    """Boolean mask of texts containing any of needles"""
+    match = np.zeros(len(texts), dtype=bool)
+    for needle in needles:
+        match |= np.char.find(texts, needle) >= 0
+    return match
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, highest first.
+
+    Same result as a stable descending sort cut to k (equal scores keep
+    input order), but only the k winners are sorted.
+    """
+    n = len(scores)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        idx = np.sort(np.concatenate([above, ties]))
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+# "2h", "3d", "5mo", "2 hours ago"... -> (count, unit); "mo" before "m"
+_RELATIVE_TIME_RE = re.compile(r'(\d+)\s*(mo|m|h|d|w|y)')
+
+
+# Recency score by _RELATIVE_TIME_RE unit, indexed by the count; counts past
+# the end use the last entry. Hours: <=6, <=12, <=24, older. Days: 1 day
+# 0.6, 0/2/3 days 0.4, up to a week 0.2, older 0.1.
+_RECENCY_LUTS = {
+    "m": [1.0],
+    "h": [0.95] * 7 + [0.85] * 6 + [0.7] * 12 + [0.5],
+    "d": [0.4, 0.6, 0.4, 0.4, 0.2, 0.2, 0.2, 0.2, 0.1],
+    "w": [0.1],
+    "mo": [0.05],
+    "y": [0.05],
+}
+
+# Hours per _RELATIVE_TIME_RE unit (minutes round down to 0)
+_UNIT_HOURS = {"m": 0, "h": 1, "d": 24, "w": 24 * 7, "mo": 24 * 30, "y": 24 * 365}
+
+# Posts older than this are dropped by find_comment_opportunities before
+# scoring (they can only score 0.1 or less on recency)
+STALE_POST_HOURS = 24 * 7
+
+
+def _parse_age_hours(relative_time: Optional[str]) -> Optional[int]:
+    """Approximate age in hours of a posted_relative string, None if unparseable"""
+    if not relative_time:
+        return None
+    m = _RELATIVE_TIME_RE.match(relative_time.lower().strip())
+    if not m:
+        return None
+    return int(m.group(1)) * _UNIT_HOURS[m.group(2)]
+
+
+# One compiled alternation per category, matched against case-folded text
+_CATEGORY_RES = {
+    category: re.compile("|".join(map(re.escape, keywords)))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+
+@dataclass(slots=True)
 class TargetCriteria:
     """Criteria for identifying target profiles"""
     industries: List[str] = None
@@ -21,6 +220,14 @@ class TargetCriteria:
     min_followers: int = 0
     connection_degrees: List[int] = None  # [1, 2] for 1st and 2nd degree
 
+    # Derived in __post_init__ (declared so the slotted class has room for them)
+    _industries_lc: tuple = field(default=(), init=False, repr=False, compare=False)
+    _titles_lc: tuple = field(default=(), init=False, repr=False, compare=False)
+    _title_keywords_lc: tuple = field(default=(), init=False, repr=False, compare=False)
+    _companies_lc: tuple = field(default=(), init=False, repr=False, compare=False)
+    _locations_lc: tuple = field(default=(), init=False, repr=False, compare=False)
+    _title_automaton: object = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         self.industries = self.industries or []
         self.titles = self.titles or []
@@ -30,6 +237,15 @@ class TargetCriteria:
         self.locations = self.locations or []
         self.connection_degrees = self.connection_degrees or [1, 2, 3]
 
+        # Case-folded once here instead of for every profile scored
+        self._industries_lc = tuple(s.casefold() for s in self.industries)
+        self._titles_lc = tuple(s.casefold() for s in self.titles)
+        self._title_keywords_lc = tuple(s.casefold() for s in self.title_keywords)
+        self._companies_lc = tuple(s.casefold() for s in self.companies)
+        self._locations_lc = tuple(s.casefold() for s in self.locations)
+
+        self._title_automaton = _build_title_automaton(self._titles_lc, self._title_keywords_lc)
+
 
 class ProfileAnalyzer:
     """
@@ -45,6 +261,47 @@ class ProfileAnalyzer:
         """
         self.criteria = criteria or TargetCriteria()
 
+        # Criteria are fixed for the analyzer's lifetime (make a new analyzer
+        # to change them), so cached scores only depend on the profile
+        self._score_cache = OrderedDict()
+
+    @staticmethod
+    def _norm(profile: LinkedInProfile, refresh: bool = False) -> dict:
+        """
+        Case-folded text fields of a profile, computed once and kept on it.
+
+        Args:
+            profile: Profile to normalize
+            refresh: Recompute even if cached (the profile may have changed)
+
+        Returns:
+            Dict with headline, title, company, industry, location and
+            title_plus_headline
+        """
+        if profile._lc is None or refresh:
+            title = (profile.title or "").casefold()
+            headline = (profile.headline or "").casefold()
+            profile._lc = {
+                "headline": headline,
+                "title": title,
+                "company": (profile.company or "").casefold(),
+                "industry": (profile.industry or "").casefold(),
+                "location": (profile.location or "").casefold(),
+                "title_plus_headline": title + " " + headline,
+            }
+        return profile._lc
+
+    @staticmethod
+    def _cache_key(profile: LinkedInProfile) -> tuple:
+        """
+        _score_cache key: the id plus every field the score reads, so an
+        edited profile is rescored rather than served a stale value
+        """
+        return (
+            profile.id, profile.title, profile.headline, profile.industry,
+            profile.company, profile.location, profile.followers, profile.connection_degree
+        )
+
     def score_profile(self, profile: LinkedInProfile) -> float:
         """
         Score a profile's relevance (0.0 to 1.0).
@@ -55,115 +312,237 @@ class ProfileAnalyzer:
         Returns:
             Relevance score between 0.0 and 1.0
         """
-        scores = []
-        weights = []
+        key = self._cache_key(profile)
+        cache = self._score_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        score = self._score_profile_uncached(profile)
+        cache[key] = score
+        if len(cache) > SCORE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return score
+
+    def _score_profile_uncached(self, profile: LinkedInProfile) -> float:
+        """score_profile without the cache"""
+        criteria = self.criteria
+        # A cache miss may mean the profile changed, so normalize afresh
+        lc = self._norm(profile, refresh=True)
+
+        # Running weighted sum over the criteria that apply, in slot order;
+        # no per-call score/weight lists
+        weighted_sum = 0.0
+        total_weight = 0.0
 
         # Industry match
-        if self.criteria.industries and profile.industry:
-            industry_match = any(
-                ind.lower() in profile.industry.lower()
-                for ind in self.criteria.industries
-            )
-            scores.append(1.0 if industry_match else 0.0)
-            weights.append(0.25)
+        if criteria.industries and profile.industry:
+            industry = lc["industry"]
+            if any(ind in industry for ind in criteria._industries_lc):
+                weighted_sum += _WEIGHTS[SLOT_INDUSTRY]
+            total_weight += _WEIGHTS[SLOT_INDUSTRY]
 
         # Title match
-        if self.criteria.titles or self.criteria.title_keywords:
-            title_score = self._score_title(profile)
-            scores.append(title_score)
-            weights.append(0.30)
+        if criteria.titles or criteria.title_keywords:
+            weighted_sum += self._score_title(profile) * _WEIGHTS[SLOT_TITLE]
+            total_weight += _WEIGHTS[SLOT_TITLE]
 
         # Company match
-        if self.criteria.companies and profile.company:
-            company_match = any(
-                comp.lower() in profile.company.lower()
-                for comp in self.criteria.companies
-            )
-            scores.append(1.0 if company_match else 0.0)
-            weights.append(0.15)
+        if criteria.companies and profile.company:
+            company = lc["company"]
+            if any(comp in company for comp in criteria._companies_lc):
+                weighted_sum += _WEIGHTS[SLOT_COMPANY]
+            total_weight += _WEIGHTS[SLOT_COMPANY]
 
         # Location match
-        if self.criteria.locations and profile.location:
-            location_match = any(
-                loc.lower() in profile.location.lower()
-                for loc in self.criteria.locations
-            )
-            scores.append(1.0 if location_match else 0.0)
-            weights.append(0.10)
-
-        # Connection degree
-        if profile.connection_degree:
-            degree = profile.connection_degree.value
-            if degree in self.criteria.connection_degrees:
+        if criteria.locations and profile.location:
+            location = lc["location"]
+            if any(loc in location for loc in criteria._locations_lc):
+                weighted_sum += _WEIGHTS[SLOT_LOCATION]
+            total_weight += _WEIGHTS[SLOT_LOCATION]
+
+        # Connection degree (an IntEnum, compared as a plain int; tested
+        # against None because OUT_OF_NETWORK is 0 and so falsy)
+        degree = profile.connection_degree
+        if degree is not None:
+            if degree in criteria.connection_degrees:
                 # Prefer closer connections
                 degree_score = 1.0 if degree == 1 else (0.7 if degree == 2 else 0.4)
-            else:
-                degree_score = 0.0
-            scores.append(degree_score)
-            weights.append(0.10)
+                weighted_sum += degree_score * _WEIGHTS[SLOT_DEGREE]
+            total_weight += _WEIGHTS[SLOT_DEGREE]
 
         # Follower/connection count bonus
-        if profile.followers and profile.followers >= self.criteria.min_followers:
+        if profile.followers and profile.followers >= criteria.min_followers:
             follower_score = min(1.0, profile.followers / 10000)
-            scores.append(follower_score)
-            weights.append(0.10)
+            weighted_sum += follower_score * _WEIGHTS[SLOT_FOLLOWERS]
+            total_weight += _WEIGHTS[SLOT_FOLLOWERS]
 
-        if not scores:
+        if total_weight == 0:
             return 0.5  # Default middle score if no criteria
 
         # Weighted average
-        total_weight = sum(weights)
-        weighted_sum = sum(s * w for s, w in zip(scores, weights))
-        return weighted_sum / total_weight if total_weight > 0 else 0.5
+        return weighted_sum / total_weight
+
+    def score_profiles_batch(self, profiles: List[LinkedInProfile]) -> np.ndarray:
+        """
+        Score many profiles at once; same values as score_profile.
+
+        Profile fields are laid out as columns and every criterion is matched
+        across the whole batch with NumPy, then the scores are one weighted
+        average per row over the criteria that apply to that profile.
+
+        Scores are shared with score_profile through the LRU cache: cached
+        profiles are looked up, only the rest go through the NumPy pass, and
+        their scores are stored for the next call.
+
+        Args:
+            profiles: Profiles to score
+
+        Returns:
+            Float array of scores, in the order of profiles
+        """
+        n = len(profiles)
+        cache = self._score_cache
+        keys = [self._cache_key(p) for p in profiles]
+        scores = np.empty(n)
+
+        misses = []
+        for i, key in enumerate(keys):
+            cached = cache.get(key)
+            if cached is None:
+                misses.append(i)
+            else:
+                cache.move_to_end(key)
+                scores[i] = cached
+
+        if misses:
+            fresh = self._score_profiles_batch_uncached([profiles[i] for i in misses])
+            scores[misses] = fresh
+            for i, score in zip(misses, fresh.tolist()):
+                cache[keys[i]] = score
+            while len(cache) > SCORE_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return scores
+
+    def _score_profiles_batch_uncached(self, profiles: List[LinkedInProfile]) -> np.ndarray:
+        """score_profiles_batch without the cache"""
+        criteria = self.criteria
+        n = len(profiles)
+        if n == 0:
+            return np.empty(0)
+
+        lcs = [self._norm(p, refresh=True) for p in profiles]
+        values = np.zeros((n, len(FEATURE_WEIGHTS)))
+        active = np.zeros((n, len(FEATURE_WEIGHTS)), dtype=bool)
+
+        # Industry / company / location: substring match on case-folded text
+        for col, key, needles in (
+            (SLOT_INDUSTRY, "industry", criteria._industries_lc),
+            (SLOT_COMPANY, "company", criteria._companies_lc),
+            (SLOT_LOCATION, "location", criteria._locations_lc),
+        ):
+            if not needles:
+                continue
+            texts = np.array([lc[key] for lc in lcs], dtype=str)
+            active[:, col] = texts != ""
+            values[:, col] = _substring_match(texts, needles)
+
+        # Title: per-profile matcher (automaton or substring loops)
+        if criteria.titles or criteria.title_keywords:
+            active[:, SLOT_TITLE] = True
+            values[:, SLOT_TITLE] = np.fromiter((self._score_title(p) for p in profiles), dtype=float, count=n)
+
+        # Connection degree (-1 = unknown)
+        degrees = np.fromiter(
+            (-1 if p.connection_degree is None else p.connection_degree for p in profiles),
+            dtype=np.int64, count=n
+        )
+        active[:, SLOT_DEGREE] = degrees != -1
+        values[:, SLOT_DEGREE] = np.where(
+            np.isin(degrees, criteria.connection_degrees),
+            np.select([degrees == 1, degrees == 2], [1.0, 0.7], 0.4),
+            0.0
+        )
+
+        # Follower count bonus
+        followers = np.fromiter((p.followers or 0 for p in profiles), dtype=np.int64, count=n)
+        active[:, SLOT_FOLLOWERS] = (followers != 0) & (followers >= criteria.min_followers)
+        values[:, SLOT_FOLLOWERS] = np.clip(followers / 10000, 0.0, 1.0)
+
+        # Profiles no criterion applies to get the default middle score
+        return _weighted_reduce(values, active, FEATURE_WEIGHTS)
 
     def _score_title(self, profile: LinkedInProfile) -> float:
         """Score based on title matching"""
         if not profile.title and not profile.headline:
             return 0.0
 
-        title_text = (profile.title or "") + " " + (profile.headline or "")
-        title_text = title_text.lower()
+        title_text = self._norm(profile)["title_plus_headline"]
+
+        automaton = self.criteria._title_automaton
+        if automaton is not None:
+            # Single pass: stop at the first title hit, or once enough distinct
+            # keywords have matched to reach the 1.0 cap
+            keyword_matches = 0
+            seen = set()
+            for _, (word, is_title, count) in automaton.iter(title_text):
+                if is_title:
+                    return 1.0
+                if word not in seen:
+                    seen.add(word)
+                    keyword_matches += count
+                    if keyword_matches >= KEYWORD_HITS_FOR_MAX:
+                        return 1.0
+            return min(1.0, keyword_matches * TITLE_KEYWORD_SCORE) if keyword_matches > 0 else 0.0
 
         # Exact title match
-        for title in self.criteria.titles:
-            if title.lower() in title_text:
+        for title in self.criteria._titles_lc:
+            if title in title_text:
                 return 1.0
 
-        # Keyword match
-        keyword_matches = sum(
-            1 for kw in self.criteria.title_keywords
-            if kw.lower() in title_text
-        )
+        # Keyword match (stops once the score is capped)
+        keyword_matches = 0
+        for kw in self.criteria._title_keywords_lc:
+            if kw in title_text:
+                keyword_matches += 1
+                if keyword_matches >= KEYWORD_HITS_FOR_MAX:
+                    return 1.0
         if keyword_matches > 0:
-            return min(1.0, keyword_matches * 0.3)
+            return min(1.0, keyword_matches * TITLE_KEYWORD_SCORE)
 
         return 0.0
 
-    def categorize_profile(self, profile: LinkedInProfile) -> str:
+    def categorize_profile(self, profile: LinkedInProfile, score: Optional[float] = None) -> str:
         """
         Categorize a profile.
 
+        Args:
+            profile: Profile to categorize
+            score: Its score_profile() result, if already computed
+
         Returns one of: "prospect", "influencer", "competitor", "partner", "other"
         """
-        score = self.score_profile(profile)
-        headline = (profile.headline or "").lower()
-        title = (profile.title or "").lower()
+        if score is None:
+            score = self.score_profile(profile)
+        lc = self._norm(profile)
+        headline = lc["headline"]
+        title = lc["title"]
+
+        hits = self._category_hits(headline, title)
 
         # Check for influencer indicators
-        influencer_keywords = ["speaker", "author", "thought leader", "influencer", "creator"]
-        if any(kw in headline or kw in title for kw in influencer_keywords):
+        if "influencer" in hits:
             if profile.followers and profile.followers > 10000:
                 return "influencer"
 
         # Check for competitor indicators
-        competitor_keywords = ["founder", "ceo", "co-founder"]
-        if any(kw in headline or kw in title for kw in competitor_keywords):
+        if "competitor" in hits:
             if score < 0.5:  # Different industry/focus
                 return "competitor"
 
         # Check for partner indicators
-        partner_keywords = ["partner", "agency", "consultant", "advisor"]
-        if any(kw in headline or kw in title for kw in partner_keywords):
+        if "partner" in hits:
             if score > 0.6:
                 return "partner"
 
@@ -173,6 +552,12 @@ class ProfileAnalyzer:
 
         return "other"
 
+    def _category_hits(self, headline: str, title: str) -> set:
+        """CATEGORY_KEYWORDS categories whose keywords appear in headline or title"""
+        # Newline-joined so no keyword can match across the two fields
+        text = headline + "\n" + title
+        return {category for category, pattern in _CATEGORY_RES.items() if pattern.search(text)}
+
     def extract_personalization_points(self, profile: LinkedInProfile) -> List[str]:
         """
         Extract points for message personalization.
@@ -202,26 +587,30 @@ class ProfileAnalyzer:
             points.append(f"Based in {profile.location}")
 
         # Recent experience
-        if profile.experience and len(profile.experience) > 0:
-            recent = profile.experience[0]
-            if isinstance(recent, dict) and "company" in recent:
-                points.append(f"Your experience at {recent['company']}")
+        if profile.most_recent_company:
+            points.append(f"Your experience at {profile.most_recent_company}")
 
         # Skills mention
-        if profile.skills and len(profile.skills) > 0:
-            top_skills = profile.skills[:3]
-            points.append(f"Your skills in {', '.join(top_skills)}")
+        if profile.skills:
+            points.append(f"Your skills in {', '.join(profile.skills[:3])}")
 
         # Follower mention (for influencers)
-        if profile.followers and profile.followers > 5000:
-            points.append(f"Your growing audience of {profile.followers:,} followers")
+        followers = profile.followers
+        if followers and followers > 5000:
+            points.append(f"Your growing audience of {followers:,} followers")
 
         return points
 
+    def extract_personalization_points_batch(self, profiles: List[LinkedInProfile]) -> List[List[str]]:
+        """extract_personalization_points for each profile, in order"""
+        extract = self.extract_personalization_points
+        return [extract(profile) for profile in profiles]
+
     def find_comment_opportunities(
         self,
         posts: List[LinkedInPost],
-        max_results: int = 10
+        max_results: int = 10,
+        include_stale: bool = False
     ) -> List[CommentOpportunity]:
         """
         Find best posts to comment on.
@@ -235,94 +624,78 @@ class ProfileAnalyzer:
         Args:
             posts: List of posts to analyze
             max_results: Maximum opportunities to return
+            include_stale: Also score posts older than STALE_POST_HOURS
+                (posts with an unknown age are always kept)
 
         Returns:
             List of CommentOpportunity sorted by score
         """
-        opportunities = []
+        if not include_stale:
+            posts = [
+                p for p in posts
+                if (_parse_age_hours(p.posted_relative) or 0) <= STALE_POST_HOURS
+            ]
 
-        for post in posts:
-            score = 0.0
-            reasons = []
+        n = len(posts)
+        if n == 0:
+            return []
 
-            # Recency score (based on relative time)
-            recency_score = self._score_recency(post.posted_relative)
-            score += recency_score * 0.3
-            if recency_score > 0.7:
-                reasons.append("Recent post")
+        # Every factor is computed for all posts at once; CommentOpportunity
+        # objects (and their reasons) are only built for the winners
+        likes = np.fromiter((p.likes for p in posts), dtype=np.int64, count=n)
+        comments = np.fromiter((p.comments for p in posts), dtype=np.int64, count=n)
+        total = np.fromiter((p.total_engagement for p in posts), dtype=np.int64, count=n)
 
-            # Engagement opportunity score
-            # Sweet spot: has some visibility but room for comments
-            engagement_score = self._score_engagement_opportunity(post)
-            score += engagement_score * 0.35
-            if engagement_score > 0.6:
-                reasons.append("Good engagement opportunity")
+        # Recency score (based on relative time)
+        recency = np.fromiter((self._score_recency(p.posted_relative) for p in posts), dtype=float, count=n)
 
-            # Total visibility score
-            if post.total_engagement > 50:
-                visibility_score = min(1.0, post.total_engagement / 500)
-                score += visibility_score * 0.2
-                reasons.append("High visibility post")
+        # Engagement opportunity score
+        # Sweet spot: has some visibility but room for comments
+        engagement = self._score_engagement_opportunity_batch(likes, comments)
+
+        # Total visibility score
+        visible = total > 50
+        visibility = np.clip(total / 500, 0.0, 1.0)
+        visibility[~visible] = 0.0
+
+        # Comment-to-like ratio (fewer comments relative to likes = opportunity)
+        ratio = np.divide(comments, likes, out=np.ones(n), where=likes > 10)
+        low_ratio = (likes > 10) & (ratio < 0.1)  # Less than 10% comments to likes
 
-            # Comment-to-like ratio (fewer comments relative to likes = opportunity)
-            if post.likes > 10:
-                ratio = post.comments / post.likes
-                if ratio < 0.1:  # Less than 10% comments to likes
-                    score += 0.15
-                    reasons.append("Low comment ratio")
+        score = recency * 0.3 + engagement * 0.35 + visibility * 0.2 + np.where(low_ratio, 0.15, 0.0)
+        np.minimum(score, 1.0, out=score)
+
+        opportunities = []
+        for i in _top_indices(score, max_results):
+            reasons = []
+            if recency[i] > 0.7:
+                reasons.append("Recent post")
+            if engagement[i] > 0.6:
+                reasons.append("Good engagement opportunity")
+            if visible[i]:
+                reasons.append("High visibility post")
+            if low_ratio[i]:
+                reasons.append("Low comment ratio")
 
             opportunities.append(CommentOpportunity(
-                post=post,
-                score=min(1.0, score),
+                post=posts[i],
+                score=float(score[i]),
                 reasons=reasons
             ))
 
-        # Sort by score and return top results
-        opportunities.sort(key=lambda x: x.score, reverse=True)
-        return opportunities[:max_results]
+        return opportunities
 
     def _score_recency(self, relative_time: Optional[str]) -> float:
         """Score based on relative time string (2h, 3d, etc.)"""
         if not relative_time:
             return 0.5
 
-        relative_time = relative_time.lower().strip()
+        m = _RELATIVE_TIME_RE.match(relative_time.lower().strip())
+        if not m:
+            return 0.5
 
-        # Parse time units
-        if "m" in relative_time and "mo" not in relative_time:  # minutes
-            return 1.0
-        elif "h" in relative_time:  # hours
-            try:
-                hours = int(''.join(filter(str.isdigit, relative_time)))
-                if hours <= 6:
-                    return 0.95
-                elif hours <= 12:
-                    return 0.85
-                elif hours <= 24:
-                    return 0.7
-                else:
-                    return 0.5
-            except ValueError:
-                return 0.7
-        elif "d" in relative_time:  # days
-            try:
-                days = int(''.join(filter(str.isdigit, relative_time)))
-                if days == 1:
-                    return 0.6
-                elif days <= 3:
-                    return 0.4
-                elif days <= 7:
-                    return 0.2
-                else:
-                    return 0.1
-            except ValueError:
-                return 0.3
-        elif "w" in relative_time:  # weeks
-            return 0.1
-        elif "mo" in relative_time:  # months
-            return 0.05
-
-        return 0.5
+        lut = _RECENCY_LUTS[m.group(2)]
+        return lut[min(int(m.group(1)), len(lut) - 1)]
 
     def _score_engagement_opportunity(self, post: LinkedInPost) -> float:
         """Score based on engagement opportunity (sweet spot analysis)"""
@@ -351,6 +724,25 @@ class ProfileAnalyzer:
 
         return 0.4
 
+    def _score_engagement_opportunity_batch(self, likes: np.ndarray, comments: np.ndarray) -> np.ndarray:
+        """
+        _score_engagement_opportunity over arrays of like/comment counts.
+
+        The if-chain becomes boolean masks; np.select takes the first
+        condition that holds, so the tiers keep their original priority.
+        """
+        return np.select(
+            [
+                (likes >= 10) & (likes <= 100) & (comments < 10),  # Sweet spot
+                (likes >= 5) & (likes <= 200) & (comments < 20),   # Good
+                (likes > 0) & (comments < likes * 0.2),            # Decent
+                (likes == 0) & (comments == 0),                    # Too early
+                comments > 50,                                     # Too crowded
+            ],
+            [1.0, 0.8, 0.6, 0.3, 0.2],
+            0.4
+        )
+
     def rank_profiles(
         self,
         profiles: List[LinkedInProfile],
@@ -366,18 +758,20 @@ class ProfileAnalyzer:
         Returns:
             List of dicts with profile, score, and category
         """
-        ranked = []
-        for profile in profiles:
-            score = self.score_profile(profile)
-            category = self.categorize_profile(profile)
-            personalization = self.extract_personalization_points(profile)
+        # Scores for the whole batch at once, from the cache where this
+        # analyzer has seen the profile before; only the top_n winners are
+        # categorized and personalized
+        scores = self.score_profiles_batch(profiles)
 
+        ranked = []
+        for i in _top_indices(scores, top_n):
+            profile = profiles[i]
+            score = float(scores[i])
             ranked.append({
                 "profile": profile,
                 "score": score,
-                "category": category,
-                "personalization_points": personalization
+                "category": self.categorize_profile(profile, score=score),
+                "personalization_points": self.extract_personalization_points(profile)
             })
 
-        ranked.sort(key=lambda x: x["score"], reverse=True)
-        return ranked[:top_n]
+        return ranked
@@ -3,26 +3,128 @@ Shared data types for LinkedIn automation
 Consistent data structures across all three approaches
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from typing import Iterable, Optional, List, Union, get_args, get_origin
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class ApproachType(Enum):
+def _field_expr(name: str, tp) -> str:
+    """Source expression that serializes self.<name>, given its annotation"""
+    attr = f"self.{name}"
+
+    optional = False
+    if get_origin(tp) is Union and type(None) in get_args(tp):
+        optional = True
+        tp = next(arg for arg in get_args(tp) if arg is not type(None))
+
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        # _value_ is a plain instance attribute; .value goes through a descriptor
+        expr = f"{attr}._value_"
+    elif tp is datetime:
+        expr = f"{attr}.isoformat()"
+    elif isinstance(tp, type) and hasattr(tp, "to_dict"):
+        expr = f"{attr}.to_dict()"
+    else:
+        return attr
+
+    return f"{expr} if {attr} is not None else None" if optional else expr
+
+
+def serializable(keys: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()):
+    """
+    Class decorator that generates a dataclass's to_dict() at definition time.
+
+    The method body is one dict literal with every key spelled out, built
+    with exec() from the field annotations: Enums serialize as their value,
+    datetimes as .isoformat(), types with their own to_dict() through it,
+    and Optional[...] of those pass None through.
+
+    Args:
+        keys: Output keys in order (default: the fields in declaration order);
+            names that aren't fields, e.g. properties, are read as-is
+        exclude: Fields to leave out; underscore-prefixed fields always are
+    """
+    def decorate(cls):
+        types = {f.name: f.type for f in fields(cls)}
+        names = list(keys) if keys is not None else [
+            name for name in types if name not in exclude and not name.startswith("_")
+        ]
+
+        items = "".join(
+            f"        {name!r}: {_field_expr(name, types[name]) if name in types else 'self.' + name},\n"
+            for name in names
+        )
+        source = f"def to_dict(self):\n    return {{\n{items}    }}\n"
+
+        namespace = {}
+        exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+        to_dict.__module__ = cls.__module__
+        cls.to_dict = to_dict
+        return cls
+
+    return decorate
+
+
+def to_dicts(items: Iterable) -> list:
+    """to_dict() of every item, e.g. for dumping a list of profiles"""
+    return [item.to_dict() for item in items]
+
+
+# Timestamp given to every profile/post created inside batch_time(); None
+# means each object reads the clock itself. A ContextVar rather than a module
+# global, so a batch open on one thread (or asyncio task) doesn't stamp
+# objects other threads create meanwhile
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("batch_now", default=None)
+
+
+def set_batch_time(dt: Optional[datetime]):
+    """Set (or with None, clear) the shared creation timestamp for this context"""
+    _batch_now.set(dt)
+
+
+def _now() -> datetime:
+    """default_factory for scraped_at: the batch timestamp if one is set"""
+    return _batch_now.get() or datetime.now()
+
+
+@contextmanager
+def batch_time(dt: Optional[datetime] = None):
+    """
+    Give every profile/post created in the with-block one shared timestamp.
+
+    Bulk conversions build thousands of objects within a second or two, so
+    a single clock read per batch is enough.
+
+    Args:
+        dt: Timestamp to use (default: now)
+    """
+    token = _batch_now.set(dt or datetime.now())
+    try:
+        yield
+    finally:
+        _batch_now.reset(token)
+
+
+class ApproachType(str, Enum):
     OFFICIAL_API = "approach1"
     PLAYWRIGHT = "approach2"
     THIRDPARTY = "approach3"
 
 
-class ConnectionDegree(Enum):
+class ConnectionDegree(IntEnum):
     FIRST = 1
     SECOND = 2
     THIRD = 3
     OUT_OF_NETWORK = 0
 
 
-@dataclass
+@serializable()
+@dataclass(slots=True)
 class LinkedInProfile:
     """Represents a LinkedIn user profile"""
     id: str
@@ -46,27 +148,33 @@ class LinkedInProfile:
 
     # Metadata
     source_approach: ApproachType = ApproachType.PLAYWRIGHT
-    scraped_at: datetime = field(default_factory=datetime.now)
+    scraped_at: datetime = field(default_factory=_now)
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "headline": self.headline,
-            "profile_url": self.profile_url,
-            "location": self.location,
-            "about": self.about,
-            "company": self.company,
-            "title": self.title,
-            "industry": self.industry,
-            "followers": self.followers,
-            "connections": self.connections,
-            "connection_degree": self.connection_degree.value,
-            "experience": self.experience,
-            "skills": self.skills,
-            "source_approach": self.source_approach.value,
-            "scraped_at": self.scraped_at.isoformat()
-        }
+    # Case-folded text fields, filled in by ProfileAnalyzer (not serialized)
+    _lc: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    # (experience[0], its company) from the last most_recent_company read
+    _recent_company: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def most_recent_company(self) -> Optional[str]:
+        """
+        Company of experience[0].
+
+        Cached against the identity of experience[0], so reassigning or
+        filling in experience later is picked up, while repeat reads skip
+        the type check and lookup (editing that entry's dict in place is not).
+        """
+        experience = self.experience
+        if not experience:
+            return None
+        recent = experience[0]
+        cached = self._recent_company
+        if cached is not None and cached[0] is recent:
+            return cached[1]
+        company = (recent.get("company") or None) if isinstance(recent, dict) else None
+        self._recent_company = (recent, company)
+        return company
 
     @classmethod
     def from_dict(cls, data: dict) -> "LinkedInProfile":
@@ -80,7 +188,13 @@ class LinkedInProfile:
         return cls(**data)
 
 
-@dataclass
+@serializable(keys=(
+    "id", "author_name", "author_profile_url", "author_headline", "author_id",
+    "content", "post_url", "likes", "comments", "shares", "total_engagement",
+    "posted_at", "posted_relative", "hashtags", "media_urls",
+    "source_approach", "scraped_at",
+))
+@dataclass(slots=True)
 class LinkedInPost:
     """Represents a LinkedIn post"""
     id: str
@@ -106,35 +220,15 @@ class LinkedInPost:
 
     # Metadata
     source_approach: ApproachType = ApproachType.PLAYWRIGHT
-    scraped_at: datetime = field(default_factory=datetime.now)
+    scraped_at: datetime = field(default_factory=_now)
 
     @property
     def total_engagement(self) -> int:
         return self.likes + self.comments + self.shares
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "author_name": self.author_name,
-            "author_profile_url": self.author_profile_url,
-            "author_headline": self.author_headline,
-            "author_id": self.author_id,
-            "content": self.content,
-            "post_url": self.post_url,
-            "likes": self.likes,
-            "comments": self.comments,
-            "shares": self.shares,
-            "total_engagement": self.total_engagement,
-            "posted_at": self.posted_at.isoformat() if self.posted_at else None,
-            "posted_relative": self.posted_relative,
-            "hashtags": self.hashtags,
-            "media_urls": self.media_urls,
-            "source_approach": self.source_approach.value,
-            "scraped_at": self.scraped_at.isoformat()
-        }
-
 
-@dataclass
+@serializable()
+@dataclass(slots=True)
 class CommentOpportunity:
     """A post identified as a good opportunity for commenting"""
     post: LinkedInPost
@@ -142,16 +236,9 @@ class CommentOpportunity:
     reasons: List[str] = field(default_factory=list)
     suggested_angle: Optional[str] = None
 
-    def to_dict(self) -> dict:
-        return {
-            "post": self.post.to_dict(),
-            "score": self.score,
-            "reasons": self.reasons,
-            "suggested_angle": self.suggested_angle
-        }
-
 
-@dataclass
+@serializable(exclude=("recipient_profile", "target_post"))
+@dataclass(slots=True)
 class ContentDraft:
     """Generated content ready to post"""
     body: str
@@ -173,20 +260,8 @@ class ContentDraft:
     # Metadata
     generated_at: datetime = field(default_factory=datetime.now)
 
-    def to_dict(self) -> dict:
-        return {
-            "body": self.body,
-            "content_type": self.content_type,
-            "title": self.title,
-            "hashtags": self.hashtags,
-            "media_urls": self.media_urls,
-            "call_to_action": self.call_to_action,
-            "personalization_points": self.personalization_points,
-            "generated_at": self.generated_at.isoformat()
-        }
-
 
-@dataclass
+@dataclass(slots=True)
 class MessageThread:
     """Represents a message conversation"""
     thread_id: str
@@ -196,7 +271,7 @@ class MessageThread:
     is_connection: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """Result from any scraping operation"""
     success: bool
@@ -0,0 +1,28 @@
+"""
+Tests for linkedin_agent helpers that don't need a browser
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from linkedin_agent import _compile_message_template
+
+
+def render(text: str, **values) -> str:
+    fields = {"name": "Ada", "company": "Acme", "headline": "CTO"}
+    fields.update(values)
+    return _compile_message_template(text).safe_substitute(**fields)
+
+
+def test_placeholders_are_filled():
+    assert render("Hi {name}, {headline} at {company}") == "Hi Ada, CTO at Acme"
+
+
+def test_placeholder_followed_by_word_character():
+    assert render("Fellow {company}ers at {company}_HQ, {name}2") == "Fellow Acmeers at Acme_HQ, Ada2"
+
+
+def test_dollar_signs_are_literal():
+    assert render("Save $5 or $name at {company}") == "Save $5 or $name at Acme"